@@ -4,10 +4,14 @@ Generate signed graphs for experimentation.
 """
 
 import argparse
+import bisect
 import random
 import sys
+from collections import Counter
+from typing import Tuple
+
 from src.graph import SignedGraph
-from src.graph_loader import GraphLoader
+from src.graph_loader import GraphLoader, GraphStreamWriter
 
 
 def generate_complete_graph(num_nodes: int, mode: str = 'random', p_positive: float = 0.5, seed: int = None) -> SignedGraph:
@@ -23,34 +27,151 @@ def generate_complete_graph(num_nodes: int, mode: str = 'random', p_positive: fl
     Returns:
         SignedGraph with specified sign pattern
     """
+    if mode not in ('random', 'all-positive', 'all-negative'):
+        raise ValueError(f"Invalid mode: {mode}. Must be 'random', 'all-positive', or 'all-negative'")
+
     if seed is not None:
         random.seed(seed)
 
     graph = SignedGraph()
 
     # Add nodes
-    for i in range(num_nodes):
-        graph.add_node(f"n{i}")
-
-    # Add edges based on mode
-    nodes = list(graph.nodes)
-    for i in range(len(nodes)):
-        for j in range(i + 1, len(nodes)):
-            if mode == 'all-positive':
-                sign = 1
-            elif mode == 'all-negative':
-                sign = -1
-            elif mode == 'random':
-                # Random sign based on probability
-                sign = 1 if random.random() < p_positive else -1
-            else:
-                raise ValueError(f"Invalid mode: {mode}. Must be 'random', 'all-positive', or 'all-negative'")
-
-            graph.add_edge(nodes[i], nodes[j], sign)
+    nodes = [f"n{i}" for i in range(num_nodes)]
+    for node in nodes:
+        graph.add_node(node)
+
+    # Add edges: mode is dispatched once, before any per-edge work
+    pairs = [
+        (nodes[i], nodes[j])
+        for i in range(num_nodes)
+        for j in range(i + 1, num_nodes)
+    ]
+
+    if mode == 'random':
+        # Draw all C(N,2) signs in one batch instead of one random.random()
+        # call per edge
+        signs = random.choices((1, -1), cum_weights=(p_positive, 1.0), k=len(pairs))
+        graph.add_edges_bulk((u, v, s) for (u, v), s in zip(pairs, signs))
+    else:
+        sign = 1 if mode == 'all-positive' else -1
+        graph.add_edges_bulk((u, v, sign) for u, v in pairs)
 
     return graph
 
 
+class _RankSelect:
+    """
+    Fenwick-tree bitset over integer indices supporting O(log N) membership
+    updates and "k-th member in index order" queries.
+
+    Lets the sparse generator pick the k-th eligible partner without
+    materializing the candidate list, while visiting members in the same
+    index order the list comprehension used.
+    """
+
+    def __init__(self, size: int, full: bool = False):
+        self.size = size
+        self.count = 0
+        self._member = [False] * size
+        self._tree = [0] * (size + 1)
+        self._top_bit = 1 << (size.bit_length() - 1) if size else 0
+        if full:
+            for i in range(size):
+                self.add(i)
+
+    def add(self, i: int):
+        """Add index i to the set (no-op if present)."""
+        if not self._member[i]:
+            self._member[i] = True
+            self.count += 1
+            i += 1
+            while i <= self.size:
+                self._tree[i] += 1
+                i += i & -i
+
+    def discard(self, i: int):
+        """Remove index i from the set (no-op if absent)."""
+        if self._member[i]:
+            self._member[i] = False
+            self.count -= 1
+            i += 1
+            while i <= self.size:
+                self._tree[i] -= 1
+                i += i & -i
+
+    def __contains__(self, i: int) -> bool:
+        return self._member[i]
+
+    def select(self, k: int) -> int:
+        """Get the k-th member (0-based) in increasing index order."""
+        pos = 0
+        remaining = k + 1
+        bit = self._top_bit
+        while bit:
+            next_pos = pos + bit
+            if next_pos <= self.size and self._tree[next_pos] < remaining:
+                pos = next_pos
+                remaining -= self._tree[pos]
+            bit >>= 1
+        return pos  # 0-based index of the k-th member
+
+    def rank(self, i: int) -> int:
+        """Count members with index strictly below i."""
+        total = 0
+        while i:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def select_excluding(self, k: int, excluded) -> int:
+        """
+        Get the k-th member in index order, skipping the indices in
+        `excluded` (an ascending list). Each excluded member positioned
+        at or before the running target shifts the target right by one.
+        """
+        for x in excluded:
+            if self._member[x] and self.rank(x) <= k:
+                k += 1
+        return self.select(k)
+
+
+def stream_complete_graph(num_nodes: int, mode: str, p_positive: float, seed: int,
+                          output_path: str, format: str) -> Tuple[int, int]:
+    """
+    Write a complete graph straight to disk without building a SignedGraph.
+
+    Avoids materializing all C(N,2) edges in memory when the graph is only
+    being generated for a file: each edge is emitted as it is drawn.
+
+    Returns:
+        (pos_edges, neg_edges) counts for summary reporting
+    """
+    if mode not in ('random', 'all-positive', 'all-negative'):
+        raise ValueError(f"Invalid mode: {mode}. Must be 'random', 'all-positive', or 'all-negative'")
+
+    if seed is not None:
+        random.seed(seed)
+
+    nodes = [f"n{i}" for i in range(num_nodes)]
+    writer = GraphStreamWriter(output_path, format, nodes)
+
+    if mode == 'random':
+        rand = random.random
+        for i in range(num_nodes):
+            u = nodes[i]
+            for j in range(i + 1, num_nodes):
+                writer.write_edge(u, nodes[j], 1 if rand() < p_positive else -1)
+    else:
+        sign = 1 if mode == 'all-positive' else -1
+        for i in range(num_nodes):
+            u = nodes[i]
+            for j in range(i + 1, num_nodes):
+                writer.write_edge(u, nodes[j], sign)
+
+    writer.close()
+    return writer.pos_edges, writer.neg_edges
+
+
 def generate_sparse_graph(num_nodes: int, min_degree: int = 3, max_degree: int = 10,
                           p_positive: float = 0.6, seed: int = None) -> SignedGraph:
     """
@@ -83,62 +204,162 @@ def generate_sparse_graph(num_nodes: int, min_degree: int = 3, max_degree: int =
     for node in nodes:
         graph.add_node(node)
 
-    # Track degree for each node
-    degree = {node: 0 for node in nodes}
+    # Track degree and adjacency by node index
+    degree = [0] * num_nodes
+    neighbor_idx = [set() for _ in range(num_nodes)]
+
+    # Nodes still below max_degree, indexed for k-th-candidate queries.
+    # The candidate lists the original code rebuilt per edge are never
+    # materialized: picking the k-th eligible index from this bitset
+    # visits candidates in the same order the list comprehension did and
+    # consumes one _randbelow draw per pick, exactly like random.choice,
+    # so seeded graphs are unchanged.
+    under_max = _RankSelect(num_nodes, full=True)
+
+    # Hoist RNG lookups out of the per-edge loops: module-global +
+    # attribute resolution per draw adds up over thousands of picks
+    randrange = random.randrange
+    rand = random.random
+
+    def pick_partner(i, relax):
+        """Pick a random partner index for node i, or None if exhausted."""
+        excluded = sorted(neighbor_idx[i])
+        bisect.insort(excluded, i)
+
+        # Candidates with degree < max_degree and no edge to node i
+        count = under_max.count - sum(1 for x in excluded if x in under_max)
+        if count > 0:
+            k = randrange(count)
+            return under_max.select_excluding(k, excluded)
+
+        if relax:
+            # No under-max candidates: allow ANY node without an edge to i,
+            # even one already at max degree
+            count = num_nodes - len(excluded)
+            if count > 0:
+                k = randrange(count)
+                for x in excluded:
+                    if x <= k:
+                        k += 1
+                return k
+
+        return None
+
+    def connect(i, j):
+        sign = 1 if rand() < p_positive else -1
+        graph.add_edge(nodes[i], nodes[j], sign)
+        for a, b in ((i, j), (j, i)):
+            degree[a] += 1
+            neighbor_idx[a].add(b)
+            if degree[a] >= max_degree:
+                under_max.discard(a)
 
     # First pass: ensure minimum degree for all nodes
-    for node in nodes:
-        while degree[node] < min_degree:
-            # Find candidates (nodes with degree < max_degree and no edge to current node)
-            candidates = [
-                other for other in nodes
-                if other != node
-                and degree[other] < max_degree
-                and not graph.has_edge(node, other)
-            ]
-
-            if not candidates:
-                # If no candidates, try to find ANY node without an edge (even if at max degree)
-                candidates = [
-                    other for other in nodes
-                    if other != node and not graph.has_edge(node, other)
-                ]
-
-            if not candidates:
+    for i in range(num_nodes):
+        while degree[i] < min_degree:
+            other = pick_partner(i, relax=True)
+            if other is None:
                 break  # No more possible edges
-
-            # Pick random candidate
-            other = random.choice(candidates)
-            sign = 1 if random.random() < p_positive else -1
-            graph.add_edge(node, other, sign)
-            degree[node] += 1
-            degree[other] += 1
+            connect(i, other)
 
     # Second pass: add random edges to increase connectivity (up to max_degree)
     # This makes the graph more interesting
-    for node in nodes:
-        if degree[node] >= max_degree:
+    for i in range(num_nodes):
+        if degree[i] >= max_degree:
             continue
 
         # Randomly decide how many more edges to add (up to max_degree)
-        target_degree = random.randint(degree[node], max_degree)
-
-        while degree[node] < target_degree:
-            candidates = [
-                other for other in nodes
-                if other != node
-                and degree[other] < max_degree
-                and not graph.has_edge(node, other)
-            ]
+        target_degree = random.randint(degree[i], max_degree)
 
-            if not candidates:
+        while degree[i] < target_degree:
+            other = pick_partner(i, relax=False)
+            if other is None:
                 break
+            connect(i, other)
+
+    return graph
+
+
+def generate_sparse_graph_fast(num_nodes: int, min_degree: int = 3, max_degree: int = 10,
+                               p_positive: float = 0.6, seed: int = None) -> SignedGraph:
+    """
+    Generate a sparse graph with a configuration-model variant in O(E).
 
-            other = random.choice(candidates)
-            sign = 1 if random.random() < p_positive else -1
-            graph.add_edge(node, other, sign)
-            degree[node] += 1
-            degree[other] += 1
+    Draws a target degree for every node, pairs up shuffled edge stubs,
+    rejects self-loops/duplicates/over-max pairs, then tops up any node
+    left below min_degree. Produces graphs with the same degree bounds
+    and sign distribution as generate_sparse_graph but a different seeded
+    edge sequence, so it is opt-in (--fast) rather than the default.
+
+    Args:
+        num_nodes: Number of nodes
+        min_degree: Minimum number of edges per node (default: 3)
+        max_degree: Maximum number of edges per node (default: 10)
+        p_positive: Probability of positive edge (default: 0.6)
+        seed: Random seed for reproducibility
+
+    Returns:
+        SignedGraph with sparse connectivity
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    if min_degree < 2:
+        raise ValueError("min_degree must be at least 2")
+    if max_degree < min_degree:
+        raise ValueError("max_degree must be >= min_degree")
+    if num_nodes < 2:
+        raise ValueError("num_nodes must be at least 2")
+
+    # Target degree sequence; stub count must be even to pair up
+    degrees = [random.randint(min_degree, max_degree) for _ in range(num_nodes)]
+    if sum(degrees) % 2 == 1:
+        degrees[0] += 1 if degrees[0] < max_degree else -1
+
+    stubs = [i for i, d in enumerate(degrees) for _ in range(d)]
+    random.shuffle(stubs)
+
+    degree = [0] * num_nodes
+    adjacent = [set() for _ in range(num_nodes)]
+    pairs = []
+    for a, b in zip(stubs[::2], stubs[1::2]):
+        if a == b or b in adjacent[a]:
+            continue  # Reject self-loops and duplicate edges
+        if degree[a] >= max_degree or degree[b] >= max_degree:
+            continue
+        adjacent[a].add(b)
+        adjacent[b].add(a)
+        degree[a] += 1
+        degree[b] += 1
+        pairs.append((a, b) if a < b else (b, a))
+
+    # Top up nodes the stub rejection left below min_degree
+    for i in range(num_nodes):
+        attempts = 4 * num_nodes
+        while degree[i] < min_degree and attempts > 0:
+            attempts -= 1
+            j = random.randrange(num_nodes)
+            if j == i or j in adjacent[i]:
+                continue
+            # Prefer under-max partners; give up the preference once
+            # random probing has mostly failed
+            if degree[j] >= max_degree and attempts > num_nodes:
+                continue
+            adjacent[i].add(j)
+            adjacent[j].add(i)
+            degree[i] += 1
+            degree[j] += 1
+            pairs.append((i, j) if i < j else (j, i))
+
+    graph = SignedGraph()
+    nodes = [f"n{i}" for i in range(num_nodes)]
+    for node in nodes:
+        graph.add_node(node)
+
+    signs = random.choices((1, -1), cum_weights=(p_positive, 1.0), k=len(pairs))
+    graph.add_edges_bulk(
+        (nodes[a], nodes[b], s) for (a, b), s in zip(pairs, signs)
+    )
 
     return graph
 
@@ -202,6 +423,20 @@ Examples:
         help="[Sparse graphs only] Maximum edges per node (default: 10)"
     )
 
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="[Complete graphs only] Stream edges directly to the output file "
+             "instead of building the graph in memory (for large N)"
+    )
+
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="[Sparse graphs only] Use the O(E) configuration-model generator "
+             "(faster for large N; seeded output differs from the default)"
+    )
+
     parser.add_argument(
         "--p-positive",
         type=float,
@@ -251,10 +486,30 @@ Examples:
         print("Error: Output file must have extension .json, .csv, or .txt", file=sys.stderr)
         sys.exit(1)
 
+    # Streaming path: emit edges directly to the file, skip the in-memory graph
+    if args.streaming:
+        if args.type != 'complete':
+            print("Error: --streaming only applies to complete graphs", file=sys.stderr)
+            sys.exit(1)
+        print(f"Generating {args.nodes}-node complete graph ({args.mode}, streaming)...", file=sys.stderr)
+        p_pos = args.p_positive if args.mode == 'random' else 0.5
+        pos_edges, neg_edges = stream_complete_graph(
+            args.nodes, args.mode, p_pos, args.seed, args.output, format
+        )
+        total_edges = pos_edges + neg_edges
+        print(f"Generated graph:", file=sys.stderr)
+        print(f"  Nodes: {args.nodes}", file=sys.stderr)
+        print(f"  Edges: {total_edges}", file=sys.stderr)
+        print(f"    Positive: {pos_edges} ({pos_edges/total_edges*100:.1f}%)", file=sys.stderr)
+        print(f"    Negative: {neg_edges} ({neg_edges/total_edges*100:.1f}%)", file=sys.stderr)
+        print(f"\nSaved to: {args.output}", file=sys.stderr)
+        return
+
     # Generate graph
     if args.type == 'sparse':
         print(f"Generating {args.nodes}-node sparse graph (degree {args.min_degree}-{args.max_degree})...", file=sys.stderr)
-        graph = generate_sparse_graph(
+        generator = generate_sparse_graph_fast if args.fast else generate_sparse_graph
+        graph = generator(
             args.nodes,
             min_degree=args.min_degree,
             max_degree=args.max_degree,
@@ -266,16 +521,15 @@ Examples:
         p_pos = args.p_positive if args.mode == 'random' else 0.5
         graph = generate_complete_graph(args.nodes, args.mode, p_pos, args.seed)
 
-    # Count edges and analyze degree
-    pos_edges = sum(1 for _, _, s in graph.get_all_edges() if s == 1)
-    neg_edges = sum(1 for _, _, s in graph.get_all_edges() if s == -1)
-    total_edges = len(graph.edges)
+    # Count edges and analyze degree (single pass over the sign values)
+    sign_counts = Counter(graph.edges.values())
+    pos_edges = sign_counts[1]
+    neg_edges = sign_counts[-1]
+    total_edges = pos_edges + neg_edges
 
     # Calculate degree stats for sparse graphs
     if args.type == 'sparse':
-        degrees = {}
-        for node in graph.nodes:
-            degrees[node] = len(list(graph.neighbors(node)))
+        degrees = {node: len(graph.neighbors(node)) for node in graph.nodes}
         min_deg = min(degrees.values())
         max_deg = max(degrees.values())
         avg_deg = sum(degrees.values()) / len(degrees)
@@ -45,7 +45,7 @@ def run_test(num_nodes, seed=42):
     # Select random scapegoat and accuser
     import random
     random.seed(seed)
-    scapegoat = random.choice(list(graph.nodes))
+    scapegoat = random.choice(graph.node_order())
     neighbors = graph.neighbors(scapegoat)
     if not neighbors:
         print(f"  ERROR: Scapegoat {scapegoat} has no neighbors!")
@@ -60,14 +60,17 @@ def run_test(num_nodes, seed=42):
     result = simulator.introduce_accusation(scapegoat, accuser)
     sim_time = time.time() - start_time
 
-    # Analyze results
-    final_edges = result.final_state.edges
-    scapegoat_edges = [e for e, sign in final_edges.items() if scapegoat in e]
-    community_edges = [e for e, sign in final_edges.items() if scapegoat not in e]
-
-    neg_to_scapegoat = sum(1 for e in scapegoat_edges if final_edges[e] == -1)
-    neg_in_community = sum(1 for e in community_edges if final_edges[e] == -1)
-    pos_in_community = sum(1 for e in community_edges if final_edges[e] == 1)
+    # Analyze results (single pass over the final edges)
+    neg_to_scapegoat = 0
+    neg_in_community = 0
+    pos_in_community = 0
+    for (u, v), sign in result.final_state.edges.items():
+        if u == scapegoat or v == scapegoat:
+            neg_to_scapegoat += sign == -1
+        elif sign == -1:
+            neg_in_community += 1
+        else:
+            pos_in_community += 1
 
     # Count decisions by phase
     bfs_decisions = [d for d in result.decisions if 'Community unity' not in d.reason]
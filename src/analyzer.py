@@ -2,14 +2,17 @@
 Analyzer: Detect triangles, classify balance, compute social scores.
 """
 
-from typing import List, Dict
-from itertools import combinations
+from typing import List, Dict, Set
 from .graph import SignedGraph
 
 
 class Triangle:
     """Represents a triangle in the graph."""
 
+    # Triangles are allocated per enumerated triangle, so skip the
+    # per-instance __dict__
+    __slots__ = ("nodes", "edges", "_product")
+
     def __init__(self, nodes: tuple, edges: tuple):
         """
         Args:
@@ -18,15 +21,17 @@ class Triangle:
         """
         self.nodes = nodes
         self.edges = edges
+        # Sign product classifies balance without counting negatives:
+        # +1 means an even number of negative edges (balanced)
+        self._product = edges[0] * edges[1] * edges[2]
 
     def is_balanced(self) -> bool:
         """Check if triangle is balanced (even number of negative edges)."""
-        num_negative = sum(1 for sign in self.edges if sign == -1)
-        return num_negative % 2 == 0
+        return self._product == 1
 
     def is_unbalanced(self) -> bool:
         """Check if triangle is unbalanced (odd number of negative edges)."""
-        return not self.is_balanced()
+        return self._product == -1
 
     def get_type(self) -> str:
         """Get triangle type: '+++', '++-', '---', or '+--'."""
@@ -37,31 +42,291 @@ class Triangle:
         return f"Triangle({self.nodes}, {self.get_type()})"
 
 
+def build_adjacency(graph: SignedGraph) -> Dict[str, Set[str]]:
+    """Build a node -> set-of-neighbors index from the graph's adjacency."""
+    return {node: set(graph._adj.get(node, ())) for node in graph.nodes}
+
+
 def find_all_triangles(graph: SignedGraph) -> List[Triangle]:
-    """Find all triangles in the graph."""
-    triangles = []
+    """
+    Find all triangles in the graph.
 
-    # Check all combinations of 3 nodes
-    for a, b, c in combinations(sorted(graph.nodes), 3):
-        # Check if all three edges exist
-        if graph.has_edge(a, b) and graph.has_edge(b, c) and graph.has_edge(a, c):
-            ab_sign = graph.get_edge(a, b)
-            bc_sign = graph.get_edge(b, c)
-            ac_sign = graph.get_edge(a, c)
+    Uses the "forward" adjacency-intersection algorithm: for each edge (a, b)
+    with rank(a) < rank(b), every common neighbor c with rank(c) > rank(b)
+    closes a triangle (a, b, c). This is O(E * d_max) on sparse graphs,
+    instead of testing all C(N, 3) node triples.
+    """
+    triangles = []
+    append = triangles.append
+    adj = graph._adj
+    rank = graph.node_index()
 
-            triangle = Triangle(
-                nodes=(a, b, c),
-                edges=(ab_sign, bc_sign, ac_sign)
-            )
-            triangles.append(triangle)
+    for a in graph.node_order():
+        rank_a = rank[a]
+        adj_a = adj[a]
+        keys_a = adj_a.keys()
+        for b, ab_sign in adj_a.items():
+            if rank[b] <= rank_a:
+                continue
+            rank_b = rank[b]
+            adj_b = adj[b]
+            for c in keys_a & adj_b.keys():
+                if rank[c] > rank_b:
+                    append(Triangle(
+                        nodes=(a, b, c),
+                        edges=(ab_sign, adj_b[c], adj_a[c])
+                    ))
 
     return triangles
 
 
 def find_unbalanced_triangles(graph: SignedGraph) -> List[Triangle]:
-    """Find all unbalanced triangles in the graph."""
-    all_triangles = find_all_triangles(graph)
-    return [t for t in all_triangles if t.is_unbalanced()]
+    """
+    Find all unbalanced triangles in the graph.
+
+    Filters during enumeration (sign product -1) rather than building the
+    full triangle list first and filtering in a second pass, so balanced
+    triangles are never materialized.
+    """
+    triangles = []
+    append = triangles.append
+    adj = graph._adj
+    rank = graph.node_index()
+
+    for a in graph.node_order():
+        rank_a = rank[a]
+        adj_a = adj[a]
+        keys_a = adj_a.keys()
+        for b, ab_sign in adj_a.items():
+            if rank[b] <= rank_a:
+                continue
+            rank_b = rank[b]
+            adj_b = adj[b]
+            for c in keys_a & adj_b.keys():
+                if rank[c] > rank_b and ab_sign * adj_b[c] * adj_a[c] == -1:
+                    append(Triangle(
+                        nodes=(a, b, c),
+                        edges=(ab_sign, adj_b[c], adj_a[c])
+                    ))
+
+    return triangles
+
+
+def count_unbalanced_triangles(graph: SignedGraph) -> int:
+    """
+    Count unbalanced triangles without materializing Triangle objects.
+
+    A triangle is unbalanced iff the product of its three edge signs is -1,
+    so counting only needs sign products. For dense graphs (most node pairs
+    connected) this works directly on the sign matrix, which avoids all
+    per-triangle dict lookups and object allocation; sparse graphs use the
+    adjacency-intersection walk.
+    """
+    num_nodes = len(graph.nodes)
+    num_edges = len(graph.edges)
+    max_edges = num_nodes * (num_nodes - 1) // 2
+    is_dense = max_edges > 0 and num_edges >= max_edges // 2
+
+    count = 0
+
+    if is_dense:
+        # Bit-packed rows: for each edge (i, j), the common neighbors with
+        # index > j are one row intersection, and the parity of negative
+        # edges per triangle falls out of popcounts. A triangle (i, j, k)
+        # is unbalanced iff it has an odd number of negatives, so with
+        # sign_ij fixed it comes down to whether exactly one of (i,k),
+        # (j,k) is negative — the XOR of the two negative rows.
+        adj_rows, neg_rows, _ = graph.to_bitrows()
+        index = graph.node_index()
+        for (u, v), sign_ij in graph.edges.items():
+            i, j = index[u], index[v]
+            shift = j + 1
+            common = (adj_rows[i] & adj_rows[j]) >> shift
+            one_neg = ((neg_rows[i] ^ neg_rows[j]) >> shift) & common
+            if sign_ij == 1:
+                count += one_neg.bit_count()
+            else:
+                count += common.bit_count() - one_neg.bit_count()
+        return count
+
+    adj = graph._adj
+    rank = graph.node_index()
+
+    for a in graph.nodes:
+        rank_a = rank[a]
+        adj_a = adj[a]
+        keys_a = adj_a.keys()
+        for b, ab_sign in adj_a.items():
+            if rank[b] <= rank_a:
+                continue
+            rank_b = rank[b]
+            adj_b = adj[b]
+            for c in keys_a & adj_b.keys():
+                if rank[c] > rank_b and ab_sign * adj_b[c] * adj_a[c] == -1:
+                    count += 1
+
+    return count
+
+
+def any_unbalanced_triangle(graph: SignedGraph) -> bool:
+    """
+    Check whether the graph contains at least one unbalanced triangle.
+
+    Same walks as count_unbalanced_triangles, but returns on the first hit —
+    callers that only need a balanced/unbalanced verdict skip the rest of
+    the enumeration (a balanced graph still pays the full scan, as it must).
+    """
+    num_nodes = len(graph.nodes)
+    num_edges = len(graph.edges)
+    max_edges = num_nodes * (num_nodes - 1) // 2
+    is_dense = max_edges > 0 and num_edges >= max_edges // 2
+
+    if is_dense:
+        adj_rows, neg_rows, _ = graph.to_bitrows()
+        index = graph.node_index()
+        for (u, v), sign_ij in graph.edges.items():
+            i, j = index[u], index[v]
+            shift = j + 1
+            common = (adj_rows[i] & adj_rows[j]) >> shift
+            one_neg = ((neg_rows[i] ^ neg_rows[j]) >> shift) & common
+            if sign_ij == 1:
+                if one_neg:
+                    return True
+            elif common != one_neg:
+                return True
+        return False
+
+    adj = graph._adj
+    rank = graph.node_index()
+
+    for a in graph.nodes:
+        rank_a = rank[a]
+        adj_a = adj[a]
+        keys_a = adj_a.keys()
+        for b, ab_sign in adj_a.items():
+            if rank[b] <= rank_a:
+                continue
+            rank_b = rank[b]
+            adj_b = adj[b]
+            for c in keys_a & adj_b.keys():
+                if rank[c] > rank_b and ab_sign * adj_b[c] * adj_a[c] == -1:
+                    return True
+
+    return False
+
+
+def get_node_triangles(graph: SignedGraph, node: str) -> List[Triangle]:
+    """
+    Find all triangles containing a specific node.
+
+    Walks only the node's adjacency: every pair of its neighbors that are
+    themselves connected closes a triangle. O(deg²) instead of a global
+    enumeration.
+    """
+    triangles = []
+    adj = graph._adj
+    adj_node = adj.get(node)
+    if not adj_node:
+        return triangles
+
+    neighbors = sorted(adj_node)
+    for i, b in enumerate(neighbors):
+        adj_b = adj[b]
+        for c in neighbors[i + 1:]:
+            if c in adj_b:
+                a2, b2, c2 = sorted((node, b, c))
+                triangles.append(Triangle(
+                    nodes=(a2, b2, c2),
+                    edges=(adj[a2][b2], adj[b2][c2], adj[a2][c2])
+                ))
+    return triangles
+
+
+def find_pressured_nodes(graph: SignedGraph) -> Set[str]:
+    """
+    Find all nodes under social pressure (members of >= 1 unbalanced triangle).
+
+    Walks only the unbalanced triangles, so balanced triangles (the vast
+    majority in a settled graph) are never built as objects just to be
+    discarded.
+    """
+    pressured: Set[str] = set()
+    for triangle in find_unbalanced_triangles(graph):
+        pressured.update(triangle.nodes)
+    return pressured
+
+
+def calculate_triangle_delta(graph: SignedGraph, u: str, v: str) -> int:
+    """
+    Compute how many triangles become balanced (minus how many become
+    unbalanced) if the edge u-v were flipped.
+
+    Flipping u-v only affects triangles containing both endpoints, i.e. one
+    per common neighbor w, so the delta is computed locally in O(d_u + d_v)
+    instead of re-enumerating all triangles before and after the flip.
+
+    Args:
+        graph: The signed graph
+        u, v: Endpoints of the candidate flip (edge must exist)
+
+    Returns:
+        net change in balanced triangles: positive means flipping improves
+        balance, negative means it worsens it
+    """
+    adj = graph._adj
+    adj_u = adj.get(u)
+    adj_v = adj.get(v)
+    old_sign = adj_u.get(v, 0) if adj_u else 0
+    if old_sign == 0:
+        raise ValueError(f"Edge ({u}, {v}) does not exist")
+
+    # Intersect the adjacency rows' key views directly — no intermediate
+    # neighbor lists or sets — and read signs straight from the rows.
+    delta = 0
+    for w in adj_u.keys() & adj_v.keys():
+        # Current sign product of triangle (u, v, w): -1 means unbalanced,
+        # and flipping u-v negates the product.
+        if old_sign * adj_u[w] * adj_v[w] == -1:
+            delta += 1
+        else:
+            delta -= 1
+    return delta
+
+
+class TriangleState:
+    """
+    Running count of unbalanced triangles, maintained under edge changes.
+
+    Enumerates the graph once at construction; after that, every flip or
+    new edge only touches the common neighbors of its two endpoints
+    (O(d_u + d_v)), since those are the only triangles whose balance can
+    change. Useful for drivers that evaluate many flips without paying a
+    full re-enumeration per step.
+    """
+
+    def __init__(self, graph: SignedGraph):
+        self.graph = graph
+        self.num_unbalanced = count_unbalanced_triangles(graph)
+
+    def is_balanced(self) -> bool:
+        """Check whether the graph currently has no unbalanced triangles."""
+        return self.num_unbalanced == 0
+
+    def apply_flip(self, u: str, v: str):
+        """Flip edge u-v on the graph and adjust the counter locally."""
+        self.num_unbalanced -= calculate_triangle_delta(self.graph, u, v)
+        self.graph.flip_edge(u, v)
+
+    def apply_new_edge(self, u: str, v: str, sign: int):
+        """Add edge u-v and count the triangles it newly closes."""
+        adj = self.graph._adj
+        adj_u = adj.get(u)
+        adj_v = adj.get(v)
+        common = adj_u.keys() & adj_v.keys() if adj_u and adj_v else ()
+        self.graph.add_edge(u, v, sign)
+        for w in common:
+            if sign * adj_u[w] * adj_v[w] == -1:
+                self.num_unbalanced += 1
 
 
 def compute_social_score(graph: SignedGraph, node: str) -> int:
@@ -75,13 +340,14 @@ def compute_social_score(graph: SignedGraph, node: str) -> int:
     Returns:
         Integer score (positive = more friends, negative = more enemies)
     """
-    neighbors = graph.neighbors(node)
-    friends = sum(1 for n in neighbors if graph.get_edge(node, n) == 1)
-    enemies = sum(1 for n in neighbors if graph.get_edge(node, n) == -1)
-
-    return friends - enemies
+    # friends - enemies is just the sum of incident edge signs
+    return sum(graph._adj.get(node, {}).values())
 
 
 def compute_all_scores(graph: SignedGraph) -> Dict[str, int]:
-    """Compute social scores for all nodes."""
-    return {node: compute_social_score(graph, node) for node in graph.nodes}
+    """Compute social scores for all nodes in one pass over the edges."""
+    scores = {node: 0 for node in graph.nodes}
+    for (u, v), sign in graph.edges.items():
+        scores[u] += sign
+        scores[v] += sign
+    return scores
@@ -7,14 +7,9 @@ import argparse
 import sys
 import random
 import os
-from datetime import datetime
-from .graph import SignedGraph
-from .simulator import MimeticContagionSimulator
-from .formatter import format_json, format_human_readable, format_simple_chain
-from .graph_loader import GraphLoader
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Simulate scapegoating contagion in signed social graphs",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -111,7 +106,32 @@ Notes:
         help="Show progress updates during simulation (useful for large graphs)"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Built on first use and reused, so programmatic drivers calling
+# main([...]) in a loop don't pay argparse construction per call
+_parser = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    global _parser
+    if _parser is None:
+        _parser = _build_parser()
+    return _parser
+
+
+def main(argv=None):
+    args = _get_parser().parse_args(argv)
+
+    # Intern user-supplied node names so they share identity with the
+    # interned names stored in the graph
+    if args.nodes:
+        args.nodes = [sys.intern(n) for n in args.nodes]
+    if args.scapegoat:
+        args.scapegoat = sys.intern(args.scapegoat)
+    if args.accuser:
+        args.accuser = sys.intern(args.accuser)
 
     # Validate that either --initial or --graph-file is provided (but not both)
     if args.initial and args.graph_file:
@@ -126,25 +146,27 @@ Notes:
         print("Error: --nodes is required when using --initial", file=sys.stderr)
         sys.exit(1)
 
-    # Set random seed if provided
+    # Dedicated RNG instance: seeding it never touches global random state,
+    # and bound methods skip the module-level lookup per draw. Random(None)
+    # self-seeds from the OS, matching the unseeded behavior.
     if args.seed is None:
         print("WARNING: No --seed provided. Results will be non-deterministic.", file=sys.stderr)
         print("         Use --seed <number> for reproducible results.\n", file=sys.stderr)
-    else:
-        random.seed(args.seed)
+    rng = random.Random(args.seed)
+
+    # Import the simulation stack only once arguments validate, so
+    # --help and usage errors don't pay for loading it
+    from .graph import SignedGraph
+    from .simulator import MimeticContagionSimulator
+    from .formatter import format_json, dump_json, format_human_readable, format_simple_chain
+    from .graph_loader import GraphLoader
 
     # Create initial graph
     if args.initial:
         if args.initial == "all-positive":
             graph = SignedGraph.create_complete_positive(args.nodes)
         else:
-            # All negative - create complete graph with negative edges
-            graph = SignedGraph()
-            for node in args.nodes:
-                graph.add_node(node)
-            for i, u in enumerate(args.nodes):
-                for v in args.nodes[i+1:]:
-                    graph.add_edge(u, v, -1)
+            graph = SignedGraph.create_complete_negative(args.nodes)
     else:
         # Load graph from file
         try:
@@ -164,8 +186,10 @@ Notes:
             print(f"Error: Scapegoat '{scapegoat}' not in graph nodes", file=sys.stderr)
             sys.exit(1)
     else:
-        # Pick random node as scapegoat
-        scapegoat = random.choice(list(graph.nodes))
+        # Pick random node as scapegoat (cached sorted order keeps the
+        # seeded pick reproducible across processes and avoids a fresh
+        # list allocation per run)
+        scapegoat = rng.choice(graph.node_order())
         print(f"Randomly selected scapegoat: {scapegoat}", file=sys.stderr)
 
     if args.accuser:
@@ -185,7 +209,7 @@ Notes:
         if not neighbors:
             print(f"Error: Scapegoat '{scapegoat}' has no neighbors (isolated node)", file=sys.stderr)
             sys.exit(1)
-        accuser = random.choice(neighbors)
+        accuser = rng.choice(neighbors)
         print(f"Randomly selected accuser: {accuser} (neighbor of {scapegoat})", file=sys.stderr)
 
     # Run simulation
@@ -199,20 +223,24 @@ Notes:
         outputs.append(("human", "txt", format_human_readable(result)))
 
     if args.format == "json" or args.format == "all":
-        outputs.append(("json", "json", format_json(result)))
+        # When writing to a file, stream the JSON directly instead of
+        # building the full string first (None marks the streamed format)
+        content = format_json(result) if args.no_files else None
+        outputs.append(("json", "json", content))
 
     if args.format == "chain" or args.format == "all":
         outputs.append(("chain", "txt", format_simple_chain(result)))
 
     # Write output
     if args.no_files:
-        # Print to stdout
+        # Print to stdout in one buffered write
+        chunks = []
         for label, ext, content in outputs:
             if args.format == "all":
-                print(f"\n{'='*70}")
-                print(f"{label.upper()} FORMAT")
-                print(f"{'='*70}\n")
-            print(content)
+                chunks.append(f"\n{'='*70}\n{label.upper()} FORMAT\n{'='*70}\n\n")
+            chunks.append(content)
+            chunks.append("\n")
+        sys.stdout.write("".join(chunks))
     else:
         # Write to files in output directory
         os.makedirs(args.output_dir, exist_ok=True)
@@ -238,7 +266,10 @@ Notes:
             filepath = os.path.join(args.output_dir, filename)
 
             with open(filepath, "w") as f:
-                f.write(content)
+                if content is None:
+                    dump_json(result, f)
+                else:
+                    f.write(content)
 
             written_files.append(filepath)
             print(f"✓ {label}: {filepath}")
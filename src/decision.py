@@ -2,57 +2,86 @@
 Decision logic: How nodes respond to scapegoating accusations.
 """
 
-from typing import Tuple, Optional, Set
+from typing import Optional, Set
 from .graph import SignedGraph
 
 
+def find_accuser_friend(graph: SignedGraph, node: str, accusers: Set[str]) -> Optional[str]:
+    """Find the first accuser who is a friend of this node, or None."""
+    # The node is fixed for the whole scan, so resolve its adjacency row
+    # once. Late in a cascade the accusers set approaches the whole graph
+    # while degrees stay bounded, so walk whichever side is smaller:
+    # the node's neighbors tested against the set, or the accusers
+    # probed against the row.
+    adj_node = graph._adj.get(node)
+    if not adj_node:
+        return None
+    if len(adj_node) <= len(accusers):
+        for neighbor, sign in adj_node.items():
+            if sign == 1 and neighbor in accusers:
+                return neighbor
+    else:
+        sign_of = adj_node.get
+        for accuser in accusers:
+            if sign_of(accuser) == 1:
+                return accuser
+    return None
+
+
 def has_accuser_friend(graph: SignedGraph, node: str, accusers: Set[str]) -> bool:
     """Check if node has any friends who are accusers."""
-    for accuser in accusers:
-        if graph.has_edge(node, accuser) and graph.get_edge(node, accuser) == 1:
-            return True
-    return False
+    return find_accuser_friend(graph, node, accusers) is not None
 
 
 def has_accuser_enemy(graph: SignedGraph, node: str, accusers: Set[str]) -> bool:
     """Check if node has any enemies who are accusers."""
     for accuser in accusers:
-        if graph.has_edge(node, accuser) and graph.get_edge(node, accuser) == -1:
+        if graph.get_edge(node, accuser) == -1:
             return True
     return False
 
 
-def find_unbalanced_triangles_with_scapegoat(graph: SignedGraph, node: str, scapegoat: str):
-    """Find all --- triangles involving this node and the scapegoat."""
-    from .analyzer import Triangle
-
-    unbalanced = []
-
-    # Check all potential third nodes
-    for third_node in graph.nodes:
-        if third_node == node or third_node == scapegoat:
-            continue
+def _find_neg_triangle_thirds(graph: SignedGraph, node: str, scapegoat: str) -> list:
+    """
+    Find third parties closing --- triangles with node and the scapegoat.
 
-        # Check if triangle exists (all three edges present)
-        if not (graph.has_edge(node, scapegoat) and
-                graph.has_edge(node, third_node) and
-                graph.has_edge(scapegoat, third_node)):
-            continue
+    Returns just the third-node names — the hot decision path only needs
+    those, so no Triangle objects are built here.
+    """
+    # The node↔scapegoat edge is the same for every candidate triangle, so
+    # check it once: unless it is negative no --- triangle can exist, and
+    # the common quiescent case returns before touching any neighbors
+    adj = graph._adj
+    adj_node = adj.get(node)
+    if not adj_node or adj_node.get(scapegoat) != -1:
+        return []
+
+    # Only common neighbors of node and scapegoat can close a triangle.
+    # Pivot on whichever endpoint has the smaller adjacency row and probe
+    # the other side per negative neighbor — O(min(deg)) candidates with
+    # no intermediate intersection set. Sorted for a deterministic
+    # resolution order.
+    adj_scapegoat = adj[scapegoat]
+    if len(adj_scapegoat) < len(adj_node):
+        pivot, other = adj_scapegoat, adj_node
+    else:
+        pivot, other = adj_node, adj_scapegoat
+    other_get = other.get
+    return sorted(
+        third_node
+        for third_node, sign in pivot.items()
+        if sign == -1 and other_get(third_node) == -1
+    )
 
-        # Get edge signs
-        node_scapegoat = graph.get_edge(node, scapegoat)
-        node_third = graph.get_edge(node, third_node)
-        scapegoat_third = graph.get_edge(scapegoat, third_node)
 
-        # Check if it's a --- triangle (all negative)
-        if node_scapegoat == -1 and node_third == -1 and scapegoat_third == -1:
-            triangle = Triangle(
-                nodes=(node, scapegoat, third_node),
-                edges=(node_scapegoat, scapegoat_third, node_third)
-            )
-            unbalanced.append((triangle, third_node))
+def find_unbalanced_triangles_with_scapegoat(graph: SignedGraph, node: str, scapegoat: str):
+    """Find all --- triangles involving this node and the scapegoat."""
+    from .analyzer import Triangle
 
-    return unbalanced
+    return [
+        (Triangle(nodes=(node, scapegoat, third_node), edges=(-1, -1, -1)), third_node)
+        for third_node in _find_neg_triangle_thirds(graph, node, scapegoat)
+    ]
 
 
 def apply_contagion_rule(
@@ -80,38 +109,35 @@ def apply_contagion_rule(
     """
     actions = []
 
-    # Check if node has edge to scapegoat
-    if not graph.has_edge(node, scapegoat):
+    # Both Rules 1 and 3 key off the same lookup, so find the triggering
+    # accuser once instead of re-scanning the accusers set per rule
+    triggering_accuser = find_accuser_friend(graph, node, accusers)
+
+    # One lookup serves both the existence check (0 = no edge) and the
+    # sign branches below
+    node_scapegoat_relation = graph.get_edge(node, scapegoat)
+
+    if node_scapegoat_relation == 0:
         # Rule 3: If friend of accuser, HEAR about scapegoat and create negative edge
-        if has_accuser_friend(graph, node, accusers):
-            triggering_accuser = next(
-                (a for a in accusers if graph.has_edge(node, a) and graph.get_edge(node, a) == 1),
-                None
-            )
+        if triggering_accuser is not None:
             reason = f"Heard from {triggering_accuser} about {scapegoat}"
             return [("hear_accusation", reason, scapegoat)]
         else:
             return [(None, "No connection to scapegoat or accusers", None)]
 
-    node_scapegoat_relation = graph.get_edge(node, scapegoat)
-
     # Rule 1: Friend of accuser + Friend of scapegoat → Flip against scapegoat
-    if has_accuser_friend(graph, node, accusers) and node_scapegoat_relation == 1:
-        # Find triggering accuser (first friend who is accuser)
-        triggering_accuser = next(
-            (a for a in accusers if graph.has_edge(node, a) and graph.get_edge(node, a) == 1),
-            None
-        )
+    if triggering_accuser is not None and node_scapegoat_relation == 1:
         reason = f"Friend of {triggering_accuser}, chose them over {scapegoat}"
         return [("join_accusers", reason, scapegoat)]
 
     # Rule 2: Enemy of scapegoat → Find all --- triangles and resolve them
     if node_scapegoat_relation == -1:
-        # Find all --- triangles involving this node and scapegoat
-        unbalanced_triangles = find_unbalanced_triangles_with_scapegoat(graph, node, scapegoat)
+        # Only the third-party names are needed here, so skip the
+        # Triangle-building wrapper
+        third_nodes = _find_neg_triangle_thirds(graph, node, scapegoat)
 
-        if unbalanced_triangles:
-            for triangle, third_node in unbalanced_triangles:
+        if third_nodes:
+            for third_node in third_nodes:
                 # Befriend the third person to resolve this --- triangle
                 reason = f"In --- triangle ({node}, {scapegoat}, {third_node}), befriend {third_node}"
                 actions.append(("befriend_other", reason, third_node))
@@ -2,103 +2,120 @@
 Output formatters for scapegoating results.
 """
 
+import io
 import json
 from .simulator import ScapegoatResult
-from .analyzer import compute_all_scores
 
 
 def format_json(result: ScapegoatResult) -> str:
     """Format scapegoating result as JSON."""
-    return json.dumps(result.to_dict(), indent=2)
+    # The serialized dict is a tree (fresh lists/dicts from to_dict), so
+    # skip the encoder's circular-reference tracking
+    return json.dumps(result.to_dict(), indent=2, check_circular=False)
+
+
+def dump_json(result: ScapegoatResult, fp):
+    """
+    Serialize scapegoating result as JSON directly to a file object.
+
+    Streams through json.dump so large results (big graphs, long decision
+    lists) never exist as one intermediate string. Produces the same bytes
+    as format_json.
+    """
+    json.dump(result.to_dict(), fp, indent=2, check_circular=False)
 
 
 def format_human_readable(result: ScapegoatResult) -> str:
     """Format scapegoating result as human-readable narrative."""
-    lines = []
+    # Written into one StringIO buffer instead of a list of per-line
+    # strings joined at the end; adjacent lines share a single write
+    buf = io.StringIO()
+    w = buf.write
+    bar = "=" * 70
 
     # Header
-    lines.append("=" * 70)
-    lines.append("SCAPEGOATING CONTAGION SIMULATION")
-    lines.append("=" * 70)
+    w(f"{bar}\nSCAPEGOATING CONTAGION SIMULATION\n{bar}\n")
 
     # Initial state
-    lines.append("\n=== INITIAL STATE ===")
-    lines.append(f"Nodes: {len(result.initial_state.nodes)}")
-    lines.append(f"Edges: {len(result.initial_state.edges)}")
-
-    pos_edges = sum(1 for _, _, s in result.initial_state.get_all_edges() if s == 1)
-    neg_edges = sum(1 for _, _, s in result.initial_state.get_all_edges() if s == -1)
-    lines.append(f"  Positive: {pos_edges}")
-    lines.append(f"  Negative: {neg_edges}")
+    w(
+        f"\n=== INITIAL STATE ===\n"
+        f"Nodes: {len(result.initial_state.nodes)}\n"
+        f"Edges: {len(result.initial_state.edges)}\n"
+        f"  Positive: {result.initial_state.count_positive()}\n"
+        f"  Negative: {result.initial_state.count_negative()}\n"
+    )
 
     # Initial accusation
-    lines.append("\n=== INITIAL ACCUSATION ===")
-    lines.append(f"Scapegoat: {result.scapegoat}")
-    lines.append(f"Initial Accuser: {result.initial_accuser}")
-
     old_sign = result.initial_state.get_edge(result.initial_accuser, result.scapegoat)
     new_sign = -1  # Always flipped to negative
-    lines.append(f"  Edge {result.initial_accuser}↔{result.scapegoat}: {_sign_str(old_sign)} → {_sign_str(new_sign)}")
+    w(
+        f"\n=== INITIAL ACCUSATION ===\n"
+        f"Scapegoat: {result.scapegoat}\n"
+        f"Initial Accuser: {result.initial_accuser}\n"
+        f"  Edge {result.initial_accuser}↔{result.scapegoat}: {_sign_str(old_sign)} → {_sign_str(new_sign)}\n"
+    )
 
     # Contagion decisions
-    lines.append(f"\n=== CONTAGION (single pass through {len(result.decisions)} nodes) ===")
+    w(f"\n=== CONTAGION (single pass through {len(result.decisions)} nodes) ===\n")
 
     if result.decisions:
         for decision in result.decisions:
-            lines.append(f"\n{decision.node}:")
-            lines.append(f"  {decision.reason}")
+            w(f"\n{decision.node}:\n  {decision.reason}\n")
 
             if decision.action:
                 u, v = decision.edge_flipped
-                lines.append(f"  Action: {u}↔{v}: {_sign_str(decision.old_sign)} → {_sign_str(decision.new_sign)}")
+                w(f"  Action: {u}↔{v}: {_sign_str(decision.old_sign)} → {_sign_str(decision.new_sign)}\n")
 
                 if decision.action == "join_accusers":
-                    lines.append(f"  → {decision.node} joins accusers")
+                    w(f"  → {decision.node} joins accusers\n")
                 elif decision.action == "hear_accusation":
-                    lines.append(f"  → {decision.node} hears accusation, forms negative opinion")
+                    w(f"  → {decision.node} hears accusation, forms negative opinion\n")
                 elif decision.action == "befriend_other":
-                    lines.append(f"  → {decision.node} resolves --- triangle")
+                    w(f"  → {decision.node} resolves --- triangle\n")
             else:
-                lines.append(f"  → No action taken")
+                w("  → No action taken\n")
     else:
-        lines.append("No nodes to process (all nodes already accusers or scapegoat)")
+        w("No nodes to process (all nodes already accusers or scapegoat)\n")
 
     # Final analysis
-    lines.append("\n" + "=" * 70)
-    lines.append("=== FINAL ANALYSIS ===")
+    w(f"\n{bar}\n=== FINAL ANALYSIS ===\n")
 
-    lines.append(f"\nAccusers ({len(result.accusers)}): {sorted(list(result.accusers))}")
+    w(f"\nAccusers ({len(result.accusers)}): {sorted(result.accusers)}\n")
 
     if result.defenders:
-        lines.append(f"Defenders ({len(result.defenders)}): {sorted(list(result.defenders))}")
-        lines.append("\n⚠ CONTAGION FAILED")
-        lines.append("Some nodes remain defenders of the scapegoat.")
-        lines.append("This represents a stronghold preventing full scapegoating.")
+        w(
+            f"Defenders ({len(result.defenders)}): {sorted(result.defenders)}\n"
+            "\n⚠ CONTAGION FAILED\n"
+            "Some nodes remain defenders of the scapegoat.\n"
+            "This represents a stronghold preventing full scapegoating.\n"
+        )
     else:
-        lines.append(f"Defenders: None")
-        lines.append("\n✓ CONTAGION SUCCEEDED")
-        lines.append("All nodes (except scapegoat) became accusers or united against scapegoat.")
+        w(
+            "Defenders: None\n"
+            "\n✓ CONTAGION SUCCEEDED\n"
+            "All nodes (except scapegoat) became accusers or united against scapegoat.\n"
+        )
 
     # Structural checks
-    lines.append(f"\nStructural Balance: {'YES' if result.is_balanced else 'NO'}")
+    w(f"\nStructural Balance: {'YES' if result.is_balanced else 'NO'}\n")
     if not result.is_balanced:
-        lines.append("  (Some unbalanced triangles remain)")
+        w("  (Some unbalanced triangles remain)\n")
 
-    lines.append(f"All-Against-One: {'YES' if result.is_all_against_one else 'NO'}")
+    w(f"All-Against-One: {'YES' if result.is_all_against_one else 'NO'}\n")
     if result.is_all_against_one:
-        lines.append(f"  ({result.scapegoat} is completely isolated)")
+        w(f"  ({result.scapegoat} is completely isolated)\n")
 
     # Show final edge counts
-    pos_edges = sum(1 for _, _, s in result.final_state.get_all_edges() if s == 1)
-    neg_edges = sum(1 for _, _, s in result.final_state.get_all_edges() if s == -1)
-    lines.append(f"\nFinal edges:")
-    lines.append(f"  Positive: {pos_edges}")
-    lines.append(f"  Negative: {neg_edges}")
+    w(
+        f"\nFinal edges:\n"
+        f"  Positive: {result.final_state.count_positive()}\n"
+        f"  Negative: {result.final_state.count_negative()}\n"
+    )
 
     # Show final social scores
-    lines.append(f"\nFinal social scores (friends - enemies):")
-    scores = compute_all_scores(result.final_state)
-    for node in sorted(scores.keys()):
+    w("\nFinal social scores (friends - enemies):\n")
+    scores = result.final_scores
+    for node in result.final_state.node_order():
         score = scores[node]
         marker = ""
         if node == result.scapegoat:
@@ -107,11 +124,11 @@ def format_human_readable(result: ScapegoatResult) -> str:
             marker = " (defender)"
         elif node == result.initial_accuser:
             marker = " (initial accuser)"
-        lines.append(f"  {node}: {score:+d}{marker}")
+        w(f"  {node}: {score:+d}{marker}\n")
 
-    lines.append("\n" + "=" * 70)
+    w(f"\n{bar}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def _sign_str(sign: int) -> str:
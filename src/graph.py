@@ -2,80 +2,230 @@
 SignedGraph: A graph with positive (+1) and negative (-1) edges.
 """
 
+import sys
 from typing import Dict, Set, Tuple, List
-from collections import defaultdict
 
 
 class SignedGraph:
     """Graph with signed edges representing friend/enemy relationships."""
 
+    __slots__ = (
+        "nodes", "edges", "_adj",
+        "_node_order", "_node_index",
+        "pos_count", "neg_count",
+    )
+
     def __init__(self):
         self.nodes: Set[str] = set()
         self.edges: Dict[Tuple[str, str], int] = {}  # {(u, v): +1 or -1}
+        # Per-node adjacency index mirroring self.edges in both directions:
+        # {u: {v: sign}}. Makes neighbors() O(deg) and edge lookups a
+        # single dict access instead of a scan over all edges.
+        self._adj: Dict[str, Dict[str, int]] = {}
+        # Cached sorted node order and name -> integer id mapping.
+        # Nodes are only ever added, so a length check detects staleness.
+        self._node_order: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        # Running sign counts, maintained on every edge mutation so
+        # positive/negative totals are O(1) queries
+        self.pos_count: int = 0
+        self.neg_count: int = 0
 
     def add_node(self, node: str):
         """Add a node to the graph."""
+        # Interned names make the many downstream dict lookups and
+        # equality tests on node names pointer comparisons
+        node = sys.intern(node)
         self.nodes.add(node)
+        if node not in self._adj:
+            self._adj[node] = {}
 
     def add_edge(self, u: str, v: str, sign: int):
         """Add or update an edge between two nodes."""
         if sign not in [-1, 1]:
             raise ValueError(f"Edge sign must be +1 or -1, got {sign}")
 
+        u = sys.intern(u)
+        v = sys.intern(v)
+
         # Ensure nodes exist
         self.add_node(u)
         self.add_node(v)
 
         # Store edge in canonical order (alphabetical)
         edge = self._canonical_edge(u, v)
+        old_sign = self._adj[u].get(v, 0)
+        if old_sign != sign:
+            if old_sign == 1:
+                self.pos_count -= 1
+            elif old_sign == -1:
+                self.neg_count -= 1
+            if sign == 1:
+                self.pos_count += 1
+            else:
+                self.neg_count += 1
         self.edges[edge] = sign
+        self._adj[u][v] = sign
+        self._adj[v][u] = sign
+
+    def add_edges_bulk(self, edges):
+        """
+        Add many edges at once with a single dict update.
+
+        Args:
+            edges: Iterable of (u, v, sign) tuples, signs must be +1 or -1
+        """
+        staged = {}
+        canonical = self._canonical_edge
+        add_node = self.add_node
+        adj = self._adj
+        intern = sys.intern
+        for u, v, sign in edges:
+            if sign not in (-1, 1):
+                raise ValueError(f"Edge sign must be +1 or -1, got {sign}")
+            u = intern(u)
+            v = intern(v)
+            if u not in adj:
+                add_node(u)
+            if v not in adj:
+                add_node(v)
+            old_sign = adj[u].get(v, 0)
+            if old_sign != sign:
+                if old_sign == 1:
+                    self.pos_count -= 1
+                elif old_sign == -1:
+                    self.neg_count -= 1
+                if sign == 1:
+                    self.pos_count += 1
+                else:
+                    self.neg_count += 1
+            staged[canonical(u, v)] = sign
+            adj[u][v] = sign
+            adj[v][u] = sign
+        self.edges.update(staged)
 
     def flip_edge(self, u: str, v: str):
         """Flip the sign of an edge."""
         edge = self._canonical_edge(u, v)
         if edge not in self.edges:
             raise ValueError(f"Edge {edge} does not exist")
-        self.edges[edge] *= -1
+        new_sign = -self.edges[edge]
+        self.edges[edge] = new_sign
+        self._adj[u][v] = new_sign
+        self._adj[v][u] = new_sign
+        if new_sign == 1:
+            self.pos_count += 1
+            self.neg_count -= 1
+        else:
+            self.pos_count -= 1
+            self.neg_count += 1
 
     def get_edge(self, u: str, v: str) -> int:
         """Get the sign of an edge between two nodes."""
-        edge = self._canonical_edge(u, v)
-        return self.edges.get(edge, 0)  # 0 means no edge
+        adj_u = self._adj.get(u)
+        if adj_u is None:
+            return 0
+        return adj_u.get(v, 0)  # 0 means no edge
 
     def has_edge(self, u: str, v: str) -> bool:
         """Check if an edge exists."""
-        edge = self._canonical_edge(u, v)
-        return edge in self.edges
+        adj_u = self._adj.get(u)
+        return adj_u is not None and v in adj_u
 
     def neighbors(self, node: str) -> List[str]:
         """Get all nodes connected to this node."""
-        neighbors = []
-        for (u, v) in self.edges.keys():
-            if u == node:
-                neighbors.append(v)
-            elif v == node:
-                neighbors.append(u)
-        return neighbors
+        return list(self._adj.get(node, ()))
+
+    def count_positive(self) -> int:
+        """Number of positive edges (maintained incrementally)."""
+        return self.pos_count
+
+    def count_negative(self) -> int:
+        """Number of negative edges (maintained incrementally)."""
+        return self.neg_count
 
     def get_all_edges(self) -> List[Tuple[str, str, int]]:
         """Get all edges as (u, v, sign) tuples."""
         return [(u, v, sign) for (u, v), sign in self.edges.items()]
 
+    def node_order(self) -> List[str]:
+        """Get the sorted node list (cached between node additions)."""
+        if len(self._node_order) != len(self.nodes):
+            self._node_order = sorted(self.nodes)
+            self._node_index = {node: i for i, node in enumerate(self._node_order)}
+        return self._node_order
+
+    def node_index(self) -> Dict[str, int]:
+        """
+        Get a name -> integer id mapping over the sorted node order (cached).
+
+        Integer ids let hot loops compare and hash small ints instead of
+        node-name strings, and give a stable rank for triangle ordering.
+        """
+        self.node_order()  # Refresh both caches together
+        return self._node_index
+
+    def to_sign_matrix(self) -> Tuple[List[List[int]], List[str]]:
+        """
+        Build an NxN sign matrix (0 = no edge) over the sorted node order.
+
+        Returns:
+            (matrix, nodes) where matrix[i][j] is the sign of the edge
+            between nodes[i] and nodes[j]
+        """
+        nodes = self.node_order()
+        index = self.node_index()
+        n = len(nodes)
+        matrix = [[0] * n for _ in range(n)]
+        for (u, v), sign in self.edges.items():
+            i, j = index[u], index[v]
+            matrix[i][j] = sign
+            matrix[j][i] = sign
+        return matrix, nodes
+
+    def to_bitrows(self) -> Tuple[List[int], List[int], List[str]]:
+        """
+        Build bit-packed adjacency rows over the sorted node order.
+
+        Returns:
+            (adj_rows, neg_rows, nodes) where bit j of adj_rows[i] is set
+            iff an edge exists between nodes[i] and nodes[j], and bit j of
+            neg_rows[i] is set iff that edge is negative. Python ints act
+            as arbitrary-width bitsets, so row intersections and popcounts
+            (int.bit_count) process 64+ nodes per machine word.
+        """
+        nodes = self.node_order()
+        index = self._node_index
+        adj_rows = [0] * len(nodes)
+        neg_rows = [0] * len(nodes)
+        for (u, v), sign in self.edges.items():
+            i, j = index[u], index[v]
+            adj_rows[i] |= 1 << j
+            adj_rows[j] |= 1 << i
+            if sign == -1:
+                neg_rows[i] |= 1 << j
+                neg_rows[j] |= 1 << i
+        return adj_rows, neg_rows, nodes
+
     def _canonical_edge(self, u: str, v: str) -> Tuple[str, str]:
         """Return edge in canonical order (alphabetical)."""
-        return tuple(sorted([u, v]))
+        # A direct comparison avoids the list + sort + tuple round-trip
+        return (u, v) if u < v else (v, u)
 
     def copy(self):
         """Create a deep copy of the graph."""
         new_graph = SignedGraph()
         new_graph.nodes = self.nodes.copy()
         new_graph.edges = self.edges.copy()
+        new_graph._adj = {node: nbrs.copy() for node, nbrs in self._adj.items()}
+        new_graph.pos_count = self.pos_count
+        new_graph.neg_count = self.neg_count
         return new_graph
 
     def to_dict(self) -> dict:
         """Serialize graph to dictionary."""
         return {
-            "nodes": sorted(list(self.nodes)),
+            "nodes": sorted(self.nodes),
             "edges": [
                 {"nodes": [u, v], "sign": sign}
                 for (u, v), sign in self.edges.items()
@@ -97,13 +247,26 @@ class SignedGraph:
     @classmethod
     def create_complete_positive(cls, nodes: List[str]):
         """Create a fully connected graph with all positive edges."""
+        return cls._create_complete(nodes, 1)
+
+    @classmethod
+    def create_complete_negative(cls, nodes: List[str]):
+        """Create a fully connected graph with all negative edges."""
+        return cls._create_complete(nodes, -1)
+
+    @classmethod
+    def _create_complete(cls, nodes: List[str], sign: int):
+        """Create a fully connected graph with a constant edge sign."""
         graph = cls()
         for node in nodes:
             graph.add_node(node)
 
-        # Connect all pairs
-        for i, u in enumerate(nodes):
-            for v in nodes[i+1:]:
-                graph.add_edge(u, v, 1)
+        # Connect all pairs (index iteration avoids a list slice per node)
+        n = len(nodes)
+        graph.add_edges_bulk(
+            (nodes[i], nodes[j], sign)
+            for i in range(n)
+            for j in range(i + 1, n)
+        )
 
         return graph
@@ -5,9 +5,69 @@ Graph file loader supporting multiple formats.
 
 import json
 import csv
-from typing import Dict, List, Tuple, Set
+from typing import List
 from .graph import SignedGraph
 
+# Sign-token tables: one dict probe per edge instead of a list-membership
+# scan per accepted spelling. Each loader keeps its documented vocabulary.
+_JSON_SIGNS = {1: 1, '+': 1, -1: -1, '-': -1}
+_CSV_SIGNS = {
+    '1': 1, '+': 1, 'positive': 1, 'friend': 1,
+    '-1': -1, '-': -1, 'negative': -1, 'enemy': -1,
+}
+_TXT_SIGNS = {'+': 1, '1': 1, '-': -1, '-1': -1}
+
+
+class GraphStreamWriter:
+    """
+    Write a graph file edge-by-edge without materializing a SignedGraph.
+
+    For generators whose only goal is the output file, this skips the
+    intermediate edge dict entirely: each edge goes straight to the
+    csv/txt/json writer, and positive/negative counts are tracked inline
+    for summary reporting.
+    """
+
+    def __init__(self, filepath: str, format: str, nodes: List[str]):
+        if format not in ('json', 'csv', 'txt'):
+            raise ValueError(f"Unsupported format: {format}")
+        self.format = format
+        self.pos_edges = 0
+        self.neg_edges = 0
+        self._file = open(filepath, 'w', newline='' if format == 'csv' else None)
+        self._first_edge = True
+        if format == 'json':
+            self._file.write('{\n  "nodes": ')
+            json.dump(sorted(nodes), self._file)
+            self._file.write(',\n  "edges": [')
+        elif format == 'csv':
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(['source', 'target', 'sign'])
+
+    def write_edge(self, u: str, v: str, sign: int):
+        """Write a single edge in the target format."""
+        if sign == 1:
+            self.pos_edges += 1
+        else:
+            self.neg_edges += 1
+
+        if self.format == 'json':
+            separator = '\n    ' if self._first_edge else ',\n    '
+            self._file.write(
+                f'{separator}{{"source": "{u}", "target": "{v}", "sign": {sign}}}'
+            )
+            self._first_edge = False
+        elif self.format == 'csv':
+            self._writer.writerow([u, v, sign])
+        else:
+            self._file.write(f"{u} {v} {'+' if sign == 1 else '-'}\n")
+
+    def close(self):
+        """Finalize and close the output file."""
+        if self.format == 'json':
+            self._file.write('\n  ]\n}\n')
+        self._file.close()
+
 
 class GraphLoader:
     """Load signed graphs from various file formats."""
@@ -58,17 +118,16 @@ class GraphLoader:
         for node in data['nodes']:
             graph.add_node(str(node))
 
-        # Add edges
-        for edge in data['edges']:
-            source = str(edge['source'])
-            target = str(edge['target'])
-            sign = edge['sign']
+        # Stage all edges through the bulk path (one dict update at the end)
+        def parse_edges():
+            for edge in data['edges']:
+                sign = edge['sign']
+                sign_val = _JSON_SIGNS.get(sign) if isinstance(sign, (int, str)) else None
+                if sign_val is None:
+                    raise ValueError(f"Invalid sign '{sign}'. Must be 1, -1, '+', or '-'")
+                yield str(edge['source']), str(edge['target']), sign_val
 
-            if sign not in [1, -1, '+', '-']:
-                raise ValueError(f"Invalid sign '{sign}'. Must be 1, -1, '+', or '-'")
-
-            sign_val = 1 if sign in [1, '+'] else -1
-            graph.add_edge(source, target, sign_val)
+        graph.add_edges_bulk(parse_edges())
 
         return graph
 
@@ -83,7 +142,6 @@ class GraphLoader:
         Sign can be: 1/-1 or +/- or positive/negative or friend/enemy
         """
         graph = SignedGraph()
-        nodes_seen: Set[str] = set()
 
         with open(filepath, 'r') as f:
             reader = csv.DictReader(f)
@@ -91,28 +149,21 @@ class GraphLoader:
             if not all(k in reader.fieldnames for k in ['source', 'target', 'sign']):
                 raise ValueError("CSV must have 'source', 'target', 'sign' columns")
 
-            for row in reader:
-                source = row['source'].strip()
-                target = row['target'].strip()
-                sign_str = row['sign'].strip().lower()
-
-                # Parse sign
-                if sign_str in ['1', '+', 'positive', 'friend']:
-                    sign = 1
-                elif sign_str in ['-1', '-', 'negative', 'enemy']:
-                    sign = -1
-                else:
-                    raise ValueError(f"Invalid sign '{sign_str}' for edge {source}-{target}")
-
-                # Add nodes if not seen
-                if source not in nodes_seen:
-                    graph.add_node(source)
-                    nodes_seen.add(source)
-                if target not in nodes_seen:
-                    graph.add_node(target)
-                    nodes_seen.add(target)
-
-                graph.add_edge(source, target, sign)
+            def parse_rows():
+                for row in reader:
+                    source = row['source'].strip()
+                    target = row['target'].strip()
+                    sign_str = row['sign'].strip().lower()
+
+                    sign = _CSV_SIGNS.get(sign_str)
+                    if sign is None:
+                        raise ValueError(f"Invalid sign '{sign_str}' for edge {source}-{target}")
+
+                    yield source, target, sign
+
+            # Bulk load registers both endpoints per edge, so no separate
+            # seen-set is needed
+            graph.add_edges_bulk(parse_rows())
 
         return graph
 
@@ -128,41 +179,33 @@ class GraphLoader:
         Sign can be: +/- or 1/-1
         """
         graph = SignedGraph()
-        nodes_seen: Set[str] = set()
 
         with open(filepath, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-
-                # Split by whitespace
-                parts = line.split()
-                if len(parts) != 3:
-                    raise ValueError(f"Line {line_num}: Expected 3 columns, got {len(parts)}")
-
-                source, target, sign_str = parts
-                sign_str = sign_str.strip()
-
-                # Parse sign
-                if sign_str in ['+', '1']:
-                    sign = 1
-                elif sign_str in ['-', '-1']:
-                    sign = -1
-                else:
-                    raise ValueError(f"Line {line_num}: Invalid sign '{sign_str}'")
-
-                # Add nodes if not seen
-                if source not in nodes_seen:
-                    graph.add_node(source)
-                    nodes_seen.add(source)
-                if target not in nodes_seen:
-                    graph.add_node(target)
-                    nodes_seen.add(target)
-
-                graph.add_edge(source, target, sign)
+
+            def parse_lines():
+                for line_num, line in enumerate(f, 1):
+                    line = line.strip()
+
+                    # Skip empty lines and comments
+                    if not line or line.startswith('#'):
+                        continue
+
+                    # Split by whitespace
+                    parts = line.split()
+                    if len(parts) != 3:
+                        raise ValueError(f"Line {line_num}: Expected 3 columns, got {len(parts)}")
+
+                    source, target, sign_str = parts
+
+                    sign = _TXT_SIGNS.get(sign_str)
+                    if sign is None:
+                        raise ValueError(f"Line {line_num}: Invalid sign '{sign_str}'")
+
+                    yield source, target, sign
+
+            # Bulk load registers both endpoints per edge, so no separate
+            # seen-set is needed
+            graph.add_edges_bulk(parse_lines())
 
         return graph
 
@@ -3,14 +3,17 @@ Mimetic Scapegoating Simulator: Propagate scapegoating contagion through a signe
 """
 
 from typing import List, Tuple, Dict, Set, Optional
-import random
 from .graph import SignedGraph
-from .analyzer import find_unbalanced_triangles
+from .analyzer import any_unbalanced_triangle, compute_all_scores
+from .decision import apply_contagion_rule
 
 
 class ContagionDecision:
     """Represents one node's decision during contagion."""
 
+    # One instance per processed node; skip the per-instance __dict__
+    __slots__ = ("node", "action", "reason", "edge_flipped", "old_sign", "new_sign")
+
     def __init__(
         self,
         node: str,
@@ -44,6 +47,13 @@ class ContagionDecision:
 class ScapegoatResult:
     """Results of scapegoating simulation."""
 
+    __slots__ = (
+        "initial_state", "scapegoat", "initial_accuser", "decisions",
+        "final_state", "accusers", "defenders", "is_balanced",
+        "is_all_against_one", "contagion_succeeded",
+        "_dict_cache", "_final_scores",
+    )
+
     def __init__(
         self,
         initial_state: SignedGraph,
@@ -66,21 +76,35 @@ class ScapegoatResult:
         self.is_balanced = is_balanced
         self.is_all_against_one = is_all_against_one
         self.contagion_succeeded = len(defenders) == 0
+        self._dict_cache: Optional[dict] = None
+        self._final_scores: Optional[Dict[str, int]] = None
+
+    @property
+    def final_scores(self) -> Dict[str, int]:
+        """Social scores of the final state (computed once, then cached)."""
+        if self._final_scores is None:
+            self._final_scores = compute_all_scores(self.final_state)
+        return self._final_scores
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
+        """Convert to dictionary for JSON serialization (cached)."""
+        # The result is immutable once constructed, so formatters asked for
+        # several output formats can share one serialized view
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "initial_state": self.initial_state.to_dict(),
             "scapegoat": self.scapegoat,
             "initial_accuser": self.initial_accuser,
             "decisions": [d.to_dict() for d in self.decisions],
             "final_state": self.final_state.to_dict(),
-            "accusers": sorted(list(self.accusers)),
-            "defenders": sorted(list(self.defenders)),
+            "accusers": sorted(self.accusers),
+            "defenders": sorted(self.defenders),
             "is_balanced": self.is_balanced,
             "is_all_against_one": self.is_all_against_one,
             "contagion_succeeded": self.contagion_succeeded
         }
+        return self._dict_cache
 
 
 class MimeticContagionSimulator:
@@ -117,8 +141,10 @@ class MimeticContagionSimulator:
             print(f"Initial Accuser: {accuser}", file=sys.stderr)
             print(f"{'='*60}\n", file=sys.stderr)
 
-        # Store initial state
-        initial_state = self.initial_graph.copy()
+        # Store initial state. self.initial_graph is never mutated (only
+        # self.graph is), so the result can share it — no third deep copy
+        # of every edge dict per run.
+        initial_state = self.initial_graph
 
         # Flip accuser↔scapegoat to negative (the initial accusation)
         old_sign = self.graph.get_edge(accuser, scapegoat)
@@ -130,34 +156,37 @@ class MimeticContagionSimulator:
 
         # IMPORTANT: Add any pre-existing enemies to accusers set BEFORE contagion
         # This ensures that when friends check "do I have accuser friends?", pre-existing
-        # enemies count as accusers (they're already against the scapegoat)
-        for node in self.graph.nodes:
-            if node == scapegoat:
-                continue
-            if self.graph.has_edge(node, scapegoat) and \
-               self.graph.get_edge(node, scapegoat) == -1:
+        # enemies count as accusers (they're already against the scapegoat).
+        # The scapegoat's adjacency row holds exactly these edges, so walk it
+        # once instead of probing every node with has_edge + get_edge.
+        for node, sign in self.graph._adj.get(scapegoat, {}).items():
+            if sign == -1:
                 accusers.add(node)
 
         # Propagate contagion (SINGLE PASS)
-        decisions = self._propagate_scapegoat_contagion(scapegoat, accusers)
+        decisions = self._propagate_scapegoat_contagion(scapegoat, accuser, accusers)
 
-        # Check final state
-        is_balanced = len(find_unbalanced_triangles(self.graph)) == 0
-        is_all_against_one = self._check_all_against_one(scapegoat)
+        # Check final state (early-exit scan: only the verdict is needed,
+        # not the full unbalanced count)
+        is_balanced = not any_unbalanced_triangle(self.graph)
 
-        # Find defenders (anyone who's still friend of scapegoat)
+        # Defenders (anyone still friend of scapegoat) and the
+        # all-against-one flag both depend only on the scapegoat's
+        # adjacency row, so derive both from one walk of that row instead
+        # of two whole-graph scans with per-node edge lookups.
         defenders = set()
-        for node in self.graph.nodes:
-            if node == scapegoat:
-                continue
-            if self.graph.has_edge(node, scapegoat) and \
-               self.graph.get_edge(node, scapegoat) == 1:
+        enemy_count = 0
+        for node, sign in self.graph._adj.get(scapegoat, {}).items():
+            if sign == 1:
                 defenders.add(node)
+            else:
+                enemy_count += 1
+        is_all_against_one = enemy_count == len(self.graph.nodes) - 1
 
         if self.verbose:
             print(f"\nFinal state:", file=sys.stderr)
-            print(f"  Accusers: {sorted(list(accusers))}", file=sys.stderr)
-            print(f"  Defenders: {sorted(list(defenders))}", file=sys.stderr)
+            print(f"  Accusers: {sorted(accusers)}", file=sys.stderr)
+            print(f"  Defenders: {sorted(defenders)}", file=sys.stderr)
             print(f"  Balanced: {is_balanced}", file=sys.stderr)
             print(f"  All-against-one: {is_all_against_one}", file=sys.stderr)
             print(f"  Contagion succeeded: {len(defenders) == 0}\n", file=sys.stderr)
@@ -174,7 +203,9 @@ class MimeticContagionSimulator:
             is_all_against_one=is_all_against_one
         )
 
-    def _propagate_scapegoat_contagion(self, scapegoat: str, accusers: Set[str]) -> List[ContagionDecision]:
+    def _propagate_scapegoat_contagion(
+        self, scapegoat: str, initial_accuser: str, accusers: Set[str]
+    ) -> List[ContagionDecision]:
         """
         Propagate scapegoating contagion through the network (BFS ORDER).
 
@@ -188,6 +219,7 @@ class MimeticContagionSimulator:
 
         Args:
             scapegoat: The scapegoat node
+            initial_accuser: The accuser the BFS traversal starts from
             accusers: Set of accusers (modified in place)
 
         Returns:
@@ -198,23 +230,21 @@ class MimeticContagionSimulator:
 
         decisions = []
 
-        # BFS traversal starting from initial accuser
-        # This ensures information spreads through social network realistically
-        initial_accuser = list(accusers)[0]  # Should only be one at this point
-
         # Edge case check: Does the accuser have any friends?
         # If the accuser has only enemies, they can't credibly spread accusations
-        # (they're already isolated/scapegoated themselves)
-        accuser_has_friends = any(
-            self.graph.get_edge(initial_accuser, neighbor) == 1
-            for neighbor in self.graph.neighbors(initial_accuser)
-            if neighbor != scapegoat
-        )
-
-        if not accuser_has_friends and self.verbose:
-            print(f"⚠ WARNING: {initial_accuser} has no friends (only enemies)!", file=sys.stderr)
-            print(f"  → Accusation cannot spread through friendship network", file=sys.stderr)
-            print(f"  → {initial_accuser} is likely already isolated/scapegoated\n", file=sys.stderr)
+        # (they're already isolated/scapegoated themselves). The check only
+        # feeds the diagnostic warning, so skip the neighbor scan entirely
+        # in quiet runs.
+        if self.verbose:
+            accuser_has_friends = any(
+                sign == 1
+                for neighbor, sign in self.graph._adj.get(initial_accuser, {}).items()
+                if neighbor != scapegoat
+            )
+            if not accuser_has_friends:
+                print(f"⚠ WARNING: {initial_accuser} has no friends (only enemies)!", file=sys.stderr)
+                print(f"  → Accusation cannot spread through friendship network", file=sys.stderr)
+                print(f"  → {initial_accuser} is likely already isolated/scapegoated\n", file=sys.stderr)
 
         visited = {scapegoat}  # Don't process scapegoat
         queue = deque([initial_accuser])
@@ -228,9 +258,6 @@ class MimeticContagionSimulator:
         while queue:
             current = queue.popleft()
 
-            # Import here to avoid circular dependency
-            from .decision import apply_contagion_rule
-
             # Process THIS node now (before discovering its neighbors)
             actions_list = apply_contagion_rule(
                 self.graph, current, scapegoat, accusers
@@ -241,7 +268,7 @@ class MimeticContagionSimulator:
                     # Rule 1: Flip against scapegoat
                     old_sign = self.graph.get_edge(current, scapegoat)
                     self.graph.flip_edge(current, scapegoat)
-                    new_sign = self.graph.get_edge(current, scapegoat)
+                    new_sign = -old_sign
 
                     decision = ContagionDecision(
                         node=current,
@@ -281,7 +308,7 @@ class MimeticContagionSimulator:
                     # Rule 2: Befriend third party to resolve --- triangle
                     old_sign = self.graph.get_edge(current, target_node)
                     self.graph.flip_edge(current, target_node)
-                    new_sign = self.graph.get_edge(current, target_node)
+                    new_sign = -old_sign
 
                     decision = ContagionDecision(
                         node=current,
@@ -310,9 +337,12 @@ class MimeticContagionSimulator:
                         print(f"  {current}: {reason}", file=sys.stderr)
 
             # AFTER processing current node, add its friends to queue
-            # This way, friends can hear from current if it became an accuser
-            for neighbor in self.graph.neighbors(current):
-                if neighbor not in visited and self.graph.get_edge(current, neighbor) == 1:
+            # This way, friends can hear from current if it became an accuser.
+            # The adjacency row already pairs each neighbor with its sign, so
+            # walk it once instead of a neighbors() copy plus a get_edge
+            # lookup per neighbor (all mutations for this node are done).
+            for neighbor, sign in self.graph._adj[current].items():
+                if sign == 1 and neighbor not in visited:
                     visited.add(neighbor)
                     queue.append(neighbor)
 
@@ -364,30 +394,29 @@ class MimeticContagionSimulator:
             List of ContagionDecision objects for community unification
         """
         import sys
-        from .decision import find_unbalanced_triangles_with_scapegoat
 
         decisions = []
 
-        # Check each node for --- triangles with scapegoat
-        for node in self.graph.nodes:
-            if node == scapegoat:
-                continue
-
-            # Only process nodes that are enemies of scapegoat
-            if not self.graph.has_edge(node, scapegoat) or \
-               self.graph.get_edge(node, scapegoat) != -1:
-                continue
+        # Every remaining --- triangle through the scapegoat is a pair of
+        # its enemies who are also enemies of each other, so enumerate the
+        # enemy pairs directly in one pass instead of scanning the whole
+        # graph once per enemy node. Sorted order makes the cleanup
+        # deterministic regardless of set iteration order.
+        adj = self.graph._adj
+        enemies = sorted(
+            neighbor
+            for neighbor, sign in adj.get(scapegoat, {}).items()
+            if sign == -1
+        )
 
-            # Find all --- triangles involving this node and scapegoat
-            unbalanced_triangles = find_unbalanced_triangles_with_scapegoat(
-                self.graph, node, scapegoat
-            )
+        for i, node in enumerate(enemies):
+            adj_node = adj[node]
+            for third_node in enemies[i + 1:]:
+                if adj_node.get(third_node) != -1:
+                    continue
 
-            for triangle, third_node in unbalanced_triangles:
                 # Befriend the third person to resolve --- triangle
-                old_sign = self.graph.get_edge(node, third_node)
                 self.graph.flip_edge(node, third_node)
-                new_sign = self.graph.get_edge(node, third_node)
 
                 reason = f"Community unity: resolve --- triangle ({node}, {scapegoat}, {third_node})"
 
@@ -396,8 +425,8 @@ class MimeticContagionSimulator:
                     action="befriend_other",
                     reason=reason,
                     edge_flipped=(node, third_node),
-                    old_sign=old_sign,
-                    new_sign=new_sign
+                    old_sign=-1,
+                    new_sign=1
                 )
                 decisions.append(decision)
 
@@ -406,14 +435,3 @@ class MimeticContagionSimulator:
                     print(f"    → {node}↔{third_node}: - → +", file=sys.stderr)
 
         return decisions
-
-    def _check_all_against_one(self, scapegoat: str) -> bool:
-        """Check if all nodes (except scapegoat) are enemies of scapegoat."""
-        for node in self.graph.nodes:
-            if node == scapegoat:
-                continue
-            if not self.graph.has_edge(node, scapegoat):
-                return False
-            if self.graph.get_edge(node, scapegoat) != -1:
-                return False
-        return True
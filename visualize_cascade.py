@@ -5,26 +5,28 @@ Visualize scapegoating contagion as 2D circular layout animation.
 
 import argparse
 import json
-import math
 import sys
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.animation import FuncAnimation, PillowWriter
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 import numpy as np
 
 
 def circular_layout(num_nodes):
-    """Generate circular layout positions for nodes."""
-    positions = {}
+    """
+    Generate circular layout positions for nodes.
+
+    Returns an (n, 2) float array indexed by node id, so frame assembly
+    reads coordinates with contiguous array indexing instead of dict
+    lookups, and the trig runs as two batched NumPy calls.
+    """
     radius = 1.0
-    for i in range(num_nodes):
-        angle = 2 * math.pi * i / num_nodes
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        positions[i] = (x, y)
-    return positions
+    angles = 2 * np.pi * np.arange(num_nodes) / max(num_nodes, 1)
+    return radius * np.stack([np.cos(angles), np.sin(angles)], axis=1)
 
 
 def load_cascade_json(filepath):
@@ -34,134 +36,224 @@ def load_cascade_json(filepath):
     return data
 
 
-def create_frame(ax, nodes, edges, positions, step_info, highlight_edge=None,
-                scapegoat=None, accusers=None, defenders=None):
-    """
-    Draw a single frame of the scapegoating contagion.
-
-    Args:
-        ax: Matplotlib axis
-        nodes: List of node names
-        edges: Dict of {(u,v): sign}
-        positions: Dict of {node: (x, y)}
-        step_info: Dict with step metadata
-        highlight_edge: Edge tuple to highlight (if any)
-        scapegoat: Name of scapegoat node
-        accusers: Set of accuser nodes
-        defenders: Set of defender nodes
-    """
-    ax.clear()
-    ax.set_xlim(-1.3, 1.3)
-    ax.set_ylim(-1.3, 1.3)
-    ax.set_aspect('equal')
-    ax.axis('off')
-
-    # Node name to index mapping
-    node_to_idx = {node: i for i, node in enumerate(nodes)}
-
-    # Draw edges
-    for (u, v), sign in edges.items():
-        if u not in node_to_idx or v not in node_to_idx:
-            continue
-
-        u_idx = node_to_idx[u]
-        v_idx = node_to_idx[v]
-        x1, y1 = positions[u_idx]
-        x2, y2 = positions[v_idx]
-
-        # Edge color and style
-        color = 'green' if sign == 1 else 'red'
-        linewidth = 1.5
-        alpha = 0.4
-
-        # Highlight the edge that just flipped
-        if highlight_edge and ((u, v) == highlight_edge or (v, u) == highlight_edge):
-            linewidth = 4
-            alpha = 1.0
-            color = 'gold' if sign == 1 else 'orange'
-
-        ax.plot([x1, x2], [y1, y2], color=color, linewidth=linewidth,
-                alpha=alpha, zorder=1)
-
-    # Draw nodes with role-based colors
-    for i, node in enumerate(nodes):
-        x, y = positions[i]
-
-        # Determine node color based on role
-        node_color = 'white'
-        edge_color = 'black'
-        edge_width = 2
-
-        if scapegoat and node == scapegoat:
-            node_color = 'lightcoral'  # Scapegoat in red
-            edge_color = 'darkred'
-            edge_width = 3
-        elif accusers and node in accusers:
-            node_color = 'lightblue'  # Accusers in blue
-            edge_color = 'darkblue'
-            edge_width = 2
-        elif defenders and node in defenders:
-            node_color = 'lightgreen'  # Defenders in green
-            edge_color = 'darkgreen'
-            edge_width = 3
-
-        ax.scatter(x, y, s=400, c=node_color, edgecolors=edge_color,
-                  linewidths=edge_width, zorder=2)
-        ax.text(x, y, node, ha='center', va='center', fontsize=9,
-               fontweight='bold', zorder=3)
-
-    # Add title and info
-    step_type = step_info.get('step_type', 'step')
-    actor = step_info.get('actor', '')
-    action_desc = step_info.get('action_desc', '')
-
+def _frame_title(step_type, actor, action_desc, scapegoat, converged=False):
+    """Format the banner title for one frame."""
     if step_type == 'initial':
-        title = "Initial State"
+        return "Initial State"
     elif step_type == 'accusation':
-        title = f"ACCUSATION: {actor} accuses {scapegoat}"
+        return f"ACCUSATION: {actor} accuses {scapegoat}"
     elif step_type == 'contagion':
-        title = f"{actor}: {action_desc}"
+        return f"{actor}: {action_desc}"
     elif step_type == 'cleanup':
-        title = f"COMMUNITY UNITY: {actor} {action_desc}"
+        return f"COMMUNITY UNITY: {actor} {action_desc}"
     elif step_type == 'final':
-        converged = step_info.get('converged', False)
         if converged:
-            title = "✓ ORDER THROUGH VIOLENCE (complete unity)"
-        else:
-            title = "⚠ CONTAGION FAILED (defenders remain)"
-    else:
-        title = "Scapegoating Contagion"
+            return "✓ ORDER THROUGH VIOLENCE (complete unity)"
+        return "⚠ CONTAGION FAILED (defenders remain)"
+    return "Scapegoating Contagion"
 
-    ax.text(0, 1.15, title, ha='center', va='center',
-           fontsize=14, fontweight='bold')
 
-    # Stats
-    pos_edges = sum(1 for s in edges.values() if s == 1)
-    neg_edges = sum(1 for s in edges.values() if s == -1)
+def _frame_stats(pos_edges, neg_edges, accusers, defenders):
+    """Format the footer stats line for one frame."""
     stats = f"Positive: {pos_edges} | Negative: {neg_edges}"
-
     if accusers:
         stats += f" | Accusers: {len(accusers)}"
     if defenders:
         stats += f" | Defenders: {len(defenders)}"
+    return stats
 
-    ax.text(0, -1.15, stats, ha='center', va='center',
-           fontsize=10, style='italic', color='gray')
 
-    # Legend
-    patches = [
-        mpatches.Patch(color='green', label='Friendship (+)'),
-        mpatches.Patch(color='red', label='Enmity (-)'),
-    ]
-    if scapegoat:
-        patches.append(mpatches.Patch(color='lightcoral', label='Scapegoat'))
-    if accusers:
-        patches.append(mpatches.Patch(color='lightblue', label='Accuser'))
-    if defenders and len(defenders) > 0:
-        patches.append(mpatches.Patch(color='lightgreen', label='Defender'))
+class CascadeAnimator:
+    """
+    Drive the contagion animation with persistent matplotlib artists.
 
-    ax.legend(handles=patches, loc='upper right',
-             fontsize=8, framealpha=0.9)
+    The axes, node labels, edge LineCollection, node scatter, and the
+    title/stats texts are created once; each frame only updates artist
+    data via set_* calls instead of ax.clear() plus a full rebuild, so
+    with blit enabled matplotlib re-rasterizes just the changed artists.
+    """
+
+    def __init__(self, ax, nodes, initial_edges, frames_data, positions):
+        """
+        Args:
+            ax: Matplotlib axis
+            nodes: List of node names
+            initial_edges: Dict of {(u,v): sign} before the accusation
+            frames_data: List of per-frame dicts (delta, title/stats, roles)
+            positions: (n, 2) array of node coordinates indexed by node id
+        """
+        self.ax = ax
+        self.nodes = nodes
+        self.initial_edges = initial_edges
+        self.frames_data = frames_data
+        self.positions = positions
+
+        # Running edge state, advanced by per-frame deltas
+        self.edges_state = initial_edges.copy()
+        self.applied_idx = 0
+
+        # Node name -> id mapping, built once for the whole animation, and
+        # a per-edge endpoint cache so segment assembly never repeats the
+        # name lookups for an edge it has already seen
+        self.node_to_idx = {node: i for i, node in enumerate(nodes)}
+        self._seg_cache = {}
+        # Edge count the collection's segments were last built for: signs
+        # flip far more often than edges appear, so geometry is only
+        # reassembled when the edge set itself grows (or resets on replay)
+        self._seg_count = -1
+
+        ax.set_xlim(-1.3, 1.3)
+        ax.set_ylim(-1.3, 1.3)
+        ax.set_aspect('equal')
+        ax.axis('off')
+
+        # Persistent artists: one collection for all edges, one scatter
+        # for all nodes, fixed text labels (matplotlib has no batched
+        # text), and the title/stats banners
+        self.edge_collection = LineCollection([], zorder=1)
+        ax.add_collection(self.edge_collection)
+
+        self.node_scatter = ax.scatter(
+            positions[:, 0], positions[:, 1], s=400,
+            c=['white'] * len(nodes), edgecolors=['black'] * len(nodes),
+            linewidths=2, zorder=2)
+
+        for i, node in enumerate(nodes):
+            x, y = positions[i]
+            ax.text(x, y, node, ha='center', va='center', fontsize=9,
+                   fontweight='bold', zorder=3)
+
+        self.title_text = ax.text(0, 1.15, '', ha='center', va='center',
+                                 fontsize=14, fontweight='bold')
+        self.stats_text = ax.text(0, -1.15, '', ha='center', va='center',
+                                 fontsize=10, style='italic', color='gray')
+
+        # Legend composition only changes when roles first appear, so it is
+        # rebuilt on those transitions rather than every frame
+        self._legend_key = None
+
+    def _advance_edges(self, frame_idx):
+        """Bring the running edge state up to the given frame."""
+        if frame_idx < self.applied_idx:
+            # FuncAnimation looped back to the start; rebuild from the base
+            self.edges_state = self.initial_edges.copy()
+            self.applied_idx = 0
+        for i in range(self.applied_idx + 1, frame_idx + 1):
+            delta = self.frames_data[i]['delta']
+            if delta:
+                edge, sign = delta
+                self.edges_state[edge] = sign
+        self.applied_idx = frame_idx
+
+    def update(self, frame_idx):
+        """Update artist data for one frame; returns the changed artists."""
+        self._advance_edges(frame_idx)
+        frame = self.frames_data[frame_idx]
+        edges = self.edges_state
+        highlight_edge = frame['highlight_edge']
+        scapegoat = frame['scapegoat']
+        accusers = frame['accusers']
+        defenders = frame['defenders']
+
+        # Edge segments and styles. The dict preserves insertion order, so
+        # color/width arrays stay aligned with the segments built on an
+        # earlier frame; geometry is rebuilt only when the edge set changed
+        node_to_idx = self.node_to_idx
+        positions = self.positions
+        seg_cache = self._seg_cache
+        rebuild_segments = len(edges) != self._seg_count
+        segments = [] if rebuild_segments else None
+        edge_colors = []
+        edge_widths = []
+        for (u, v), sign in edges.items():
+            segment = seg_cache.get((u, v))
+            if segment is None:
+                if u not in node_to_idx or v not in node_to_idx:
+                    continue
+                segment = (positions[node_to_idx[u]], positions[node_to_idx[v]])
+                seg_cache[(u, v)] = segment
+
+            if rebuild_segments:
+                segments.append(segment)
+
+            # Edge color and style
+            color = 'green' if sign == 1 else 'red'
+            linewidth = 1.5
+            alpha = 0.4
+
+            # Highlight the edge that just flipped
+            if highlight_edge and ((u, v) == highlight_edge or (v, u) == highlight_edge):
+                linewidth = 4
+                alpha = 1.0
+                color = 'gold' if sign == 1 else 'orange'
+
+            # Alpha is baked into the RGBA color so the collection can mix
+            # faded and highlighted edges in one artist
+            edge_colors.append(to_rgba(color, alpha))
+            edge_widths.append(linewidth)
+
+        if rebuild_segments:
+            self.edge_collection.set_segments(segments)
+            self._seg_count = len(edges)
+        self.edge_collection.set_color(edge_colors)
+        self.edge_collection.set_linewidth(edge_widths)
+
+        # Node role colors: start from the neutral style and paint each
+        # role's members by index, instead of branching on three set
+        # memberships per node per frame. Assignment order (defenders,
+        # then accusers, then scapegoat) preserves the old precedence.
+        n = len(self.nodes)
+        node_colors = ['white'] * n
+        node_edge_colors = ['black'] * n
+        node_edge_widths = [2] * n
+
+        for node in defenders:
+            i = node_to_idx.get(node)
+            if i is not None:
+                node_colors[i] = 'lightgreen'  # Defenders in green
+                node_edge_colors[i] = 'darkgreen'
+                node_edge_widths[i] = 3
+        for node in accusers:
+            i = node_to_idx.get(node)
+            if i is not None:
+                node_colors[i] = 'lightblue'  # Accusers in blue
+                node_edge_colors[i] = 'darkblue'
+                node_edge_widths[i] = 2
+        if scapegoat:
+            i = node_to_idx.get(scapegoat)
+            if i is not None:
+                node_colors[i] = 'lightcoral'  # Scapegoat in red
+                node_edge_colors[i] = 'darkred'
+                node_edge_widths[i] = 3
+
+        self.node_scatter.set_facecolor(node_colors)
+        self.node_scatter.set_edgecolor(node_edge_colors)
+        self.node_scatter.set_linewidth(node_edge_widths)
+
+        # Title and stats were rendered once at frame-build time, so the
+        # per-tick work here is just handing the strings to the artists
+        self.title_text.set_text(frame['title'])
+        self.stats_text.set_text(frame['stats'])
+
+        # Legend (rebuilt only when its composition changes)
+        legend_key = (bool(scapegoat), bool(accusers), bool(defenders))
+        if legend_key != self._legend_key:
+            self._legend_key = legend_key
+            patches = [
+                mpatches.Patch(color='green', label='Friendship (+)'),
+                mpatches.Patch(color='red', label='Enmity (-)'),
+            ]
+            if scapegoat:
+                patches.append(mpatches.Patch(color='lightcoral', label='Scapegoat'))
+            if accusers:
+                patches.append(mpatches.Patch(color='lightblue', label='Accuser'))
+            if defenders and len(defenders) > 0:
+                patches.append(mpatches.Patch(color='lightgreen', label='Defender'))
+            self.ax.legend(handles=patches, loc='upper right',
+                          fontsize=8, framealpha=0.9)
+
+        return (self.edge_collection, self.node_scatter,
+                self.title_text, self.stats_text, self.ax.get_legend())
 
 
 def visualize_cascade(json_path, output_path=None, fps=2, pause_on_final=True):
@@ -200,7 +292,13 @@ def visualize_cascade(json_path, output_path=None, fps=2, pause_on_final=True):
     # Create circular layout
     positions = circular_layout(num_nodes)
 
-    # Prepare frames data
+    # Prepare frames data. Each frame stores only the edge change it
+    # introduces ('delta': ((u, v), new_sign) or None) rather than a full
+    # copy of the edge dict — O(E + F) memory for a cascade instead of
+    # O(E * F). The animator replays deltas onto one running edge state.
+    # Title and stats strings are rendered here, once per frame, so the
+    # animation callback never re-derives them (a looping GIF replays each
+    # frame every cycle); edge counts are carried incrementally per delta.
     frames_data = []
 
     # Initial state
@@ -210,13 +308,13 @@ def visualize_cascade(json_path, output_path=None, fps=2, pause_on_final=True):
         sign = edge_data['sign']
         initial_edges[(u, v)] = sign
 
+    pos_count = sum(1 for s in initial_edges.values() if s == 1)
+    neg_count = len(initial_edges) - pos_count
+
     frames_data.append({
-        'edges': initial_edges.copy(),
-        'step_info': {
-            'step_type': 'initial',
-            'actor': '',
-            'action_desc': ''
-        },
+        'delta': None,
+        'title': _frame_title('initial', '', '', None),
+        'stats': _frame_stats(pos_count, neg_count, set(), set()),
         'highlight_edge': None,
         'scapegoat': None,
         'accusers': set(),
@@ -227,22 +325,25 @@ def visualize_cascade(json_path, output_path=None, fps=2, pause_on_final=True):
     current_edges = initial_edges.copy()
     accusers = {initial_accuser}
 
-    # Find and flip accusation edge if needed
+    # Find and flip accusation edge if needed. Edge keys are (u, v) node
+    # pairs, so the pair is probed directly in both orientations instead
+    # of scanning the whole edge dict for a match.
     accuser_scapegoat_edge = None
-    for (u, v) in current_edges:
-        if (u == initial_accuser and v == scapegoat) or (v == initial_accuser and u == scapegoat):
-            accuser_scapegoat_edge = (u, v)
-            if current_edges[accuser_scapegoat_edge] == 1:
-                current_edges[accuser_scapegoat_edge] = -1
+    accusation_delta = None
+    for candidate in ((initial_accuser, scapegoat), (scapegoat, initial_accuser)):
+        if candidate in current_edges:
+            accuser_scapegoat_edge = candidate
+            if current_edges[candidate] == 1:
+                current_edges[candidate] = -1
+                accusation_delta = (candidate, -1)
+                pos_count -= 1
+                neg_count += 1
             break
 
     frames_data.append({
-        'edges': current_edges.copy(),
-        'step_info': {
-            'step_type': 'accusation',
-            'actor': initial_accuser,
-            'action_desc': f'accuses {scapegoat}'
-        },
+        'delta': accusation_delta,
+        'title': _frame_title('accusation', initial_accuser, '', scapegoat),
+        'stats': _frame_stats(pos_count, neg_count, accusers, set()),
         'highlight_edge': accuser_scapegoat_edge,
         'scapegoat': scapegoat,
         'accusers': accusers.copy(),
@@ -260,7 +361,16 @@ def visualize_cascade(json_path, output_path=None, fps=2, pause_on_final=True):
             from_sign = decision['from_sign']
             to_sign = decision['to_sign']
 
-            # Update edges
+            # Update edges and the running sign counts
+            old_sign = current_edges.get(edge_flipped, 0)
+            if old_sign == 1:
+                pos_count -= 1
+            elif old_sign == -1:
+                neg_count -= 1
+            if to_sign == 1:
+                pos_count += 1
+            else:
+                neg_count += 1
             current_edges[edge_flipped] = to_sign
 
             # Determine step type and description
@@ -283,12 +393,9 @@ def visualize_cascade(json_path, output_path=None, fps=2, pause_on_final=True):
                 action_desc = reason
 
             frames_data.append({
-                'edges': current_edges.copy(),
-                'step_info': {
-                    'step_type': step_type,
-                    'actor': node,
-                    'action_desc': action_desc
-                },
+                'delta': (edge_flipped, to_sign),
+                'title': _frame_title(step_type, node, action_desc, scapegoat),
+                'stats': _frame_stats(pos_count, neg_count, accusers, set()),
                 'highlight_edge': edge_flipped,
                 'scapegoat': scapegoat,
                 'accusers': accusers.copy(),
@@ -296,53 +403,50 @@ def visualize_cascade(json_path, output_path=None, fps=2, pause_on_final=True):
             })
         else:
             # No action (defender or neutral)
+            defenders = {node} if 'Defender' in reason else set()
             frames_data.append({
-                'edges': current_edges.copy(),
-                'step_info': {
-                    'step_type': 'contagion',
-                    'actor': node,
-                    'action_desc': reason
-                },
+                'delta': None,
+                'title': _frame_title('contagion', node, reason, scapegoat),
+                'stats': _frame_stats(pos_count, neg_count, accusers, defenders),
                 'highlight_edge': None,
                 'scapegoat': scapegoat,
                 'accusers': accusers.copy(),
-                'defenders': {node} if 'Defender' in reason else set()
+                'defenders': defenders
             })
 
-    # Final state (hold for emphasis)
-    final_step_info = {
-        'step_type': 'final',
-        'actor': '',
-        'action_desc': '',
-        'converged': contagion_succeeded
-    }
-
-    # Add final frame (repeat 3x for pause effect if requested)
+    # Final state (hold for emphasis): repeat 3x for pause effect if
+    # requested. The hold frames are identical, so one shared dict serves
+    # all repeats — the animator re-renders it per tick, which is what
+    # produces the pause with a fixed-frame-rate writer.
     repeat_count = int(fps * 3) if pause_on_final else 1
-    for _ in range(repeat_count):
-        frames_data.append({
-            'edges': current_edges.copy(),
-            'step_info': final_step_info,
-            'highlight_edge': None,
-            'scapegoat': scapegoat,
-            'accusers': final_accusers,
-            'defenders': final_defenders
-        })
+    final_frame = {
+        'delta': None,
+        'title': _frame_title('final', '', '', scapegoat,
+                              converged=contagion_succeeded),
+        'stats': _frame_stats(pos_count, neg_count,
+                              final_accusers, final_defenders),
+        'highlight_edge': None,
+        'scapegoat': scapegoat,
+        'accusers': final_accusers,
+        'defenders': final_defenders
+    }
+    frames_data.extend([final_frame] * repeat_count)
 
     print(f"  Frames: {len(frames_data)}", file=sys.stderr)
 
-    # Create animation
-    fig, ax = plt.subplots(figsize=(10, 10))
-
-    def update(frame_idx):
-        frame = frames_data[frame_idx]
-        create_frame(ax, nodes, frame['edges'], positions,
-                    frame['step_info'], frame['highlight_edge'],
-                    frame['scapegoat'], frame['accusers'], frame['defenders'])
-        return ax,
+    # Create animation: persistent artists updated in place per frame,
+    # blitting so only changed artists are re-rasterized. GIF output
+    # renders at a smaller raster (480x480 instead of 1000x1000) — well
+    # above typical GIF display size, and every frame costs proportionally
+    # less to rasterize and LZW-encode
+    if output_path and output_path.endswith('.gif'):
+        fig, ax = plt.subplots(figsize=(6, 6), dpi=80)
+    else:
+        fig, ax = plt.subplots(figsize=(10, 10))
+    animator = CascadeAnimator(ax, nodes, initial_edges, frames_data, positions)
 
-    anim = FuncAnimation(fig, update, frames=len(frames_data),
-                        interval=1000/fps, blit=False, repeat=True)
+    anim = FuncAnimation(fig, animator.update, frames=len(frames_data),
+                        interval=1000/fps, blit=True, repeat=True)
 
     # Save or show
     if output_path: